@@ -0,0 +1,348 @@
+"""
+Benchmark harness for the export pipeline.
+Times filtering, every formatter, a cold dataset load (JSON vs columnar) and
+the full /export route at several synthetic dataset sizes, and saves the
+results as JSON for comparison.
+
+Usage:
+    python -m export.benchmark
+    python -m export.benchmark --scales 1,10 --iterations 5
+    python -m export.benchmark --output before.json
+    python -m export.benchmark --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List, Dict, Any, Callable, Optional
+from wsgiref.util import setup_testing_defaults
+
+import run
+from export import columnar
+from export.dataset_store import DatasetStore
+from export.export_formatter import ExportFormatter
+from export.export_handler import ExportHandler
+from export.generate_static import THEMES, generate_all
+from export.result_cache import get_result_cache
+
+EFFECTS_PATH = "data/effects.json"
+RESULTS_DIR = "export/benchmarks"
+
+DEFAULT_SCALES = [1, 10, 100]
+
+# Filter sets covering each filter kind alone and combined
+FILTER_CASES = {
+    "none": {},
+    "search": {"search": "damage"},
+    "search_miss": {"search": "no effect matches this"},
+    "types": {"type_filters": {"positive": False, "negative": True, "scaling": False}},
+    "no_vanilla": {"vanilla_filter": False},
+    "combined": {
+        "search": "level",
+        "type_filters": {"positive": True, "negative": False, "scaling": True},
+        "vanilla_filter": False,
+    },
+}
+
+# Query strings for the in-process /export route
+ROUTE_CASES = {
+    "unfiltered": "ignore_filters=true",
+    "search": "search=damage",
+    "combined": "search=level&negative=false&vanilla=false",
+}
+
+
+def scale_dataset(data: Dict[str, Any], factor: int) -> Dict[str, Any]:
+    """Return a copy of the dataset with every effect repeated factor times.
+
+    Copies get distinct mod names and ids so filters and mod grouping behave
+    like a genuinely larger dataset.
+    """
+    effects = []
+    for copy_idx in range(factor):
+        for effect in data["effects"]:
+            if copy_idx == 0:
+                effects.append(effect)
+                continue
+            effects.append(
+                {
+                    **effect,
+                    "id": f"{effect['id']}-{copy_idx}",
+                    "mod": f"{effect['mod']} {copy_idx}",
+                }
+            )
+    return {**data, "effects": effects}
+
+
+def measure(fn: Callable[[], Any], iterations: int, items: int) -> Dict[str, Any]:
+    """Time fn over several iterations and trace peak memory in one extra run."""
+    # Warm-up run (imports, lazily built indexes and styles)
+    fn()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    # Peak memory is traced separately so tracing overhead skews no timings
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+        "mean_ms": total / iterations * 1000,
+        "ops_per_sec": iterations / total if total else 0.0,
+        "effects_per_sec": iterations * items / total if total else 0.0,
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def call_route(app, path: str, query_string: str) -> int:
+    """Run one request through the WSGI app and return the body size."""
+    environ = {}
+    setup_testing_defaults(environ)
+    environ["PATH_INFO"] = path
+    environ["QUERY_STRING"] = query_string
+
+    status_holder = []
+
+    def start_response(status, headers, exc_info=None):
+        status_holder.append(status)
+
+    body = app(environ, start_response)
+    try:
+        size = sum(len(chunk) for chunk in body)
+    finally:
+        if hasattr(body, "close"):
+            body.close()
+
+    if not status_holder[0].startswith("200"):
+        raise RuntimeError(f"{path}?{query_string} returned {status_holder[0]}")
+    return size
+
+
+def bench_scale(
+    data: Dict[str, Any], factor: int, iterations: int, formats: List[str]
+) -> List[Dict[str, Any]]:
+    """Run every benchmark case against the dataset scaled by factor."""
+    results = []
+    scaled = scale_dataset(data, factor)
+    count = len(scaled["effects"])
+
+    def record(name: str, fn: Callable[[], Any], **params):
+        stats = measure(fn, iterations, count)
+        results.append(
+            {"case": name, "scale": factor, "effects": count, **params, **stats}
+        )
+        label = " ".join(f"{k}={v}" for k, v in params.items())
+        print(
+            f"  {name:<14} {label:<32} p50 {stats['p50_ms']:9.2f} ms"
+            f"  p99 {stats['p99_ms']:9.2f} ms"
+            f"  peak {stats['peak_memory_kb']:9.0f} KB"
+        )
+
+    # Each scale runs in its own workspace so the route sees the scaled data
+    with tempfile.TemporaryDirectory(prefix="export-bench-") as workspace:
+        previous_cwd = os.getcwd()
+        os.makedirs(os.path.join(workspace, "data"))
+        with open(os.path.join(workspace, EFFECTS_PATH), "w", encoding="utf-8") as f:
+            json.dump(scaled, f, ensure_ascii=False, indent=2)
+
+        os.chdir(workspace)
+        try:
+            handler = ExportHandler(EFFECTS_PATH)
+            effects = handler.effects
+
+            for name, filters in FILTER_CASES.items():
+                record("filter", lambda: handler.filter_effects(filters), filters=name)
+
+            if "json" in formats:
+                formatter = ExportFormatter("light")
+                record("format_json", lambda: formatter.format_json(effects))
+
+            for theme in THEMES:
+                formatter = ExportFormatter(theme)
+                if "csv" in formats:
+                    record(
+                        "format_csv",
+                        lambda: formatter.format_csv(effects),
+                        theme=theme,
+                    )
+                if "xlsx" in formats:
+                    for engine in ExportFormatter.XLSX_ENGINES:
+                        engine_formatter = ExportFormatter(theme, engine)
+                        record(
+                            "format_xlsx",
+                            lambda: engine_formatter.format_xlsx(effects),
+                            theme=theme,
+                            engine=engine,
+                        )
+
+            # Cold dataset load (snapshot plus search index), from the JSON and
+            # from the columnar file built for it
+            def cold_load():
+                DatasetStore(EFFECTS_PATH).get().search_index
+
+            record("load", cold_load, source="json")
+            columnar.build(EFFECTS_PATH)
+            record("load", cold_load, source="columnar")
+
+            # Full route, with fresh pre-built files as in production
+            generate_all(verbose=False)
+            cache = get_result_cache()
+            for format_type in formats:
+                for case, query in ROUTE_CASES.items():
+                    path = f"/export/{format_type}"
+
+                    def cold():
+                        cache.clear()
+                        call_route(run.app, path, query)
+
+                    record("route_cold", cold, format=format_type, filters=case)
+                    record(
+                        "route_warm",
+                        lambda: call_route(run.app, path, query),
+                        format=format_type,
+                        filters=case,
+                    )
+        finally:
+            os.chdir(previous_cwd)
+
+    return results
+
+
+def git_revision() -> Optional[str]:
+    """Return the current commit hash, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def result_key(result: Dict[str, Any]) -> tuple:
+    """Identify a benchmark case independently of its measurements."""
+    ignored = {
+        "iterations",
+        "p50_ms",
+        "p99_ms",
+        "mean_ms",
+        "ops_per_sec",
+        "effects_per_sec",
+        "peak_memory_kb",
+    }
+    return tuple(sorted((k, v) for k, v in result.items() if k not in ignored))
+
+
+def compare(current: List[Dict[str, Any]], baseline_path: str):
+    """Print p50 and peak memory ratios against a previously saved run."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+
+    print(f"\nComparison against {baseline_path} (current / baseline):")
+    for result in current:
+        before = baseline.get(result_key(result))
+        if before is None:
+            continue
+        time_ratio = result["p50_ms"] / before["p50_ms"] if before["p50_ms"] else 0
+        mem_ratio = (
+            result["peak_memory_kb"] / before["peak_memory_kb"]
+            if before["peak_memory_kb"]
+            else 0
+        )
+        flag = "  ⚠ slower" if time_ratio > 1.2 else ""
+        label = " ".join(
+            f"{k}={v}" for k, v in result_key(result) if k not in ("effects",)
+        )
+        print(f"  {label:<60} time x{time_ratio:5.2f}  mem x{mem_ratio:5.2f}{flag}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(s) for s in DEFAULT_SCALES),
+        help="Comma-separated dataset multipliers (default: 1,10,100)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=None,
+        help="Timed iterations per case (default: 20 at 1x, fewer at larger scales)",
+    )
+    parser.add_argument(
+        "--formats",
+        default="json,csv,xlsx",
+        help="Comma-separated export formats to benchmark",
+    )
+    parser.add_argument(
+        "--output", help="Result JSON path (default: export/benchmarks/)"
+    )
+    parser.add_argument("--compare", help="Baseline result JSON to compare against")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+
+    with open(EFFECTS_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    results = []
+    for factor in scales:
+        iterations = args.iterations or max(3, 20 // factor)
+        print(
+            f"\nScale {factor}x ({len(data['effects']) * factor} effects, {iterations} iterations)"
+        )
+        results.extend(bench_scale(data, factor, iterations, formats))
+
+    report = {
+        "created": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"bench-{report['revision'] or stamp}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Compact columnar encodings of effects.json.
+Repeated values (mod, type, maxLevel, tag sets) are stored once in
+dictionaries and referenced by small integer columns. Two encodings exist:
+a memory-mapped binary file for Python readers (free text in UTF-8 heaps,
+effects decoded only when accessed) and a minified JSON payload for the
+browser. effects.json stays the source of truth; the binary file records
+the hash, mtime and size of the JSON it was built from, so a reader can trust
+it without reading the JSON while mtime and size still match. It lives under
+export/files/, outside the public web root, since it is a server-side cache
+only.
+
+Usage:
+    python -m export.columnar                # build export/files/effects-<hash>.columnar
+    python -m export.columnar --check        # exit 1 if missing or stale
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+MAGIC = b"MCSECOL1"
+CLIENT_PAYLOAD_FORMAT = 1
+EFFECTS_PATH = "data/effects.json"
+COLUMNAR_DIR = "export/files"
+
+# Fields stored as dictionary ids / as UTF-8 heap strings
+DICT_FIELDS = ("mod", "maxLevel", "type", "tags")
+TEXT_FIELDS = ("id", "effect", "description", "source")
+
+# Column arrays start on 8-byte boundaries so memoryview.cast stays aligned
+_ALIGN = 8
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def columnar_path(json_path: str) -> str:
+    """Return the columnar file path for a JSON dataset (in COLUMNAR_DIR).
+
+    The name includes a hash of the JSON's absolute path, so datasets with
+    the same file name in different directories never share a file.
+    """
+    abspath = os.path.abspath(json_path)
+    stem = os.path.splitext(os.path.basename(abspath))[0]
+    digest = hashlib.sha256(abspath.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(COLUMNAR_DIR, f"{stem}-{digest}.columnar")
+
+
+def _id_typecode(size: int) -> str:
+    """Smallest unsigned array typecode that can index size entries."""
+    if size <= 0xFF:
+        return "B"
+    if size <= 0xFFFF:
+        return "H"
+    return "I"
+
+
+def dictionary_encode(column: Iterable[Any]) -> Tuple[List[Any], List[int]]:
+    """Split a column into (distinct values in first-seen order, ids into them)."""
+    values: List[Any] = []
+    index: Dict[str, int] = {}
+    ids = []
+    for value in column:
+        key = json.dumps(value)
+        if key not in index:
+            index[key] = len(values)
+            values.append(value)
+        ids.append(index[key])
+    return values, ids
+
+
+def client_payload(
+    data: Dict[str, Any], source_sha256: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the columnar browser payload (decoded by MCSE.decodeEffectsPayload).
+
+    {"format": 1, "source_sha256": hash of the JSON, "count": n,
+     "fields": [...], "dicts": {field: [values]},
+     "columns": {field: [ids or raw values]}}
+    """
+    effects = data["effects"]
+    fields = list(effects[0]) if effects else list(DICT_FIELDS + TEXT_FIELDS)
+    payload: Dict[str, Any] = {
+        "format": CLIENT_PAYLOAD_FORMAT,
+        "source_sha256": source_sha256,
+        "count": len(effects),
+        "fields": fields,
+        "dicts": {},
+        "columns": {},
+    }
+    for name in fields:
+        column = [effect[name] for effect in effects]
+        if name in DICT_FIELDS:
+            payload["dicts"][name], column = dictionary_encode(column)
+        payload["columns"][name] = column
+    return payload
+
+
+def client_payload_path(json_path: str) -> str:
+    """Return the browser payload path next to a JSON dataset."""
+    return os.path.splitext(json_path)[0] + ".min.json"
+
+
+def client_payload_bytes(json_path: str = EFFECTS_PATH) -> bytes:
+    """Return the minified browser payload for a JSON dataset."""
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    payload = client_payload(json.loads(raw), hashlib.sha256(raw).hexdigest())
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def client_payload_is_current(json_path: str = EFFECTS_PATH) -> bool:
+    """Return True if the written browser payload matches the JSON dataset."""
+    try:
+        with open(client_payload_path(json_path), "rb") as f:
+            return f.read() == client_payload_bytes(json_path)
+    except OSError:
+        return False
+
+
+def write_client_payload(json_path: str = EFFECTS_PATH) -> int:
+    """Write the minified browser payload. Returns its size in bytes."""
+    content = client_payload_bytes(json_path)
+    path = client_payload_path(json_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return len(content)
+
+
+def encode(raw: bytes, source_stat: Optional[Tuple[int, int]] = None) -> bytes:
+    """Encode raw effects.json bytes into the columnar format.
+
+    source_stat is the JSON file's (mtime_ns, size) when raw was read, if known.
+    """
+    data = json.loads(raw)
+    effects = data["effects"]
+    fields = list(effects[0]) if effects else list(DICT_FIELDS + TEXT_FIELDS)
+    if sorted(fields) != sorted(DICT_FIELDS + TEXT_FIELDS):
+        raise ValueError(f"Unexpected effect fields: {fields}")
+    # Key order may vary between effects; rows are rebuilt in `fields` order
+    field_set = set(fields)
+    for effect in effects:
+        if effect.keys() != field_set:
+            raise ValueError(f"Effect {effect.get('id')!r} has different fields")
+
+    header: Dict[str, Any] = {
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+        "source_mtime_ns": source_stat[0] if source_stat else None,
+        "source_size": source_stat[1] if source_stat else None,
+        "count": len(effects),
+        "fields": fields,
+        "extra": {k: v for k, v in data.items() if k != "effects"},
+        "dicts": {},
+        "columns": {},
+    }
+    blobs: List[bytes] = []
+    offset = 0
+
+    def add_blob(blob: bytes) -> int:
+        nonlocal offset
+        start = offset
+        padding = -len(blob) % _ALIGN
+        blobs.append(blob + b"\0" * padding)
+        offset += len(blob) + padding
+        return start
+
+    for name in DICT_FIELDS:
+        values, ids = dictionary_encode(effect[name] for effect in effects)
+        typecode = _id_typecode(len(values))
+        column = array(typecode, ids)
+        if not _LITTLE_ENDIAN:
+            column.byteswap()
+        header["dicts"][name] = values
+        header["columns"][name] = {
+            "typecode": typecode,
+            "offset": add_blob(column.tobytes()),
+        }
+
+    for name in TEXT_FIELDS:
+        heap = bytearray()
+        offsets = array("I", [0])
+        for effect in effects:
+            heap += effect[name].encode("utf-8")
+            offsets.append(len(heap))
+        if not _LITTLE_ENDIAN:
+            offsets.byteswap()
+        header["columns"][name] = {
+            "offsets": add_blob(offsets.tobytes()),
+            "heap": add_blob(bytes(heap)),
+            "heap_size": len(heap),
+        }
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes
+    prefix += b"\0" * (-len(prefix) % _ALIGN)
+    return prefix + b"".join(blobs)
+
+
+class ColumnarDataset(Sequence):
+    """Memory-mapped columnar dataset; a read-only sequence of effect dicts.
+
+    Rows are decoded on access. column() decodes one field for every
+    effect without touching the others (dictionary fields never touch the
+    text heap at all).
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a columnar effects file")
+        (header_len,) = struct.unpack_from("<I", buffer, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(buffer[header_start : header_start + header_len]))
+        base = header_start + header_len
+        base += -base % _ALIGN
+
+        self.source_sha256: str = header["source_sha256"]
+        self.source_mtime_ns: Optional[int] = header.get("source_mtime_ns")
+        self.source_size: Optional[int] = header.get("source_size")
+        self.fields: List[str] = header["fields"]
+        self.extra: Dict[str, Any] = header["extra"]
+        self.count: int = header["count"]
+        self.dicts: Dict[str, List[Any]] = header["dicts"]
+
+        self._ids: Dict[str, Any] = {}
+        self._offsets: Dict[str, Any] = {}
+        self._heaps: Dict[str, memoryview] = {}
+        for name, spec in header["columns"].items():
+            if name in self.dicts:
+                self._ids[name] = self._view(
+                    buffer, base + spec["offset"], spec["typecode"], self.count
+                )
+            else:
+                self._offsets[name] = self._view(
+                    buffer, base + spec["offsets"], "I", self.count + 1
+                )
+                start = base + spec["heap"]
+                self._heaps[name] = buffer[start : start + spec["heap_size"]]
+
+    @staticmethod
+    def _view(buffer: memoryview, start: int, typecode: str, length: int):
+        """Zero-copy integer column (copied only on big-endian hosts)."""
+        size = array(typecode).itemsize
+        raw = buffer[start : start + size * length]
+        if _LITTLE_ENDIAN:
+            return raw.cast(typecode)
+        column = array(typecode, bytes(raw))
+        column.byteswap()
+        return column
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("effect index out of range")
+        return self._row(index)
+
+    def _value(self, name: str, index: int) -> Any:
+        if name in self.dicts:
+            value = self.dicts[name][self._ids[name][index]]
+            return list(value) if isinstance(value, list) else value
+        offsets = self._offsets[name]
+        return str(self._heaps[name][offsets[index] : offsets[index + 1]], "utf-8")
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        return {name: self._value(name, index) for name in self.fields}
+
+    def column(self, name: str) -> List[Any]:
+        """Decode one field for every effect."""
+        if name in self.dicts:
+            values = self.dicts[name]
+            if name == "tags":
+                return [list(values[i]) for i in self._ids[name]]
+            return [values[i] for i in self._ids[name]]
+
+        offsets = self._offsets[name].tolist()
+        heap = bytes(self._heaps[name])
+        return [
+            heap[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(self.count)
+        ]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Decode every effect, column by column."""
+        columns = [self.column(name) for name in self.fields]
+        return [dict(zip(self.fields, row)) for row in zip(*columns)]
+
+    def close(self):
+        """Release the memory map (views handed out become invalid)."""
+        self._ids.clear()
+        self._offsets.clear()
+        self._heaps.clear()
+        self._mmap.close()
+
+
+def _open(json_path: str) -> Optional[ColumnarDataset]:
+    try:
+        return ColumnarDataset(columnar_path(json_path))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def load_if_current(json_path: str, source_sha256: str) -> Optional[ColumnarDataset]:
+    """Open the columnar file if it was built from JSON with this hash, else None."""
+    dataset = _open(json_path)
+    if dataset is not None and dataset.source_sha256 != source_sha256:
+        dataset.close()
+        return None
+    return dataset
+
+
+def load_if_unchanged(
+    json_path: str, stat_result: os.stat_result
+) -> Optional[ColumnarDataset]:
+    """Open the columnar file if the JSON's mtime and size are unchanged, else None.
+
+    Spares reading and hashing the JSON itself.
+    """
+    dataset = _open(json_path)
+    if dataset is None:
+        return None
+    recorded = (dataset.source_mtime_ns, dataset.source_size)
+    if recorded != (stat_result.st_mtime_ns, stat_result.st_size):
+        dataset.close()
+        return None
+    return dataset
+
+
+def build(json_path: str = EFFECTS_PATH) -> bool:
+    """(Re)build the columnar file if stale. Returns True if it was written."""
+    before = os.stat(json_path)
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    after = os.stat(json_path)
+    source_stat = (after.st_mtime_ns, after.st_size)
+    if source_stat != (before.st_mtime_ns, before.st_size):
+        source_stat = None  # changed while reading; readers fall back to hashing
+
+    current = load_if_current(json_path, hashlib.sha256(raw).hexdigest())
+    if current is not None:
+        recorded = (current.source_mtime_ns, current.source_size)
+        current.close()
+        if source_stat is None or recorded == source_stat:
+            return False
+
+    path = columnar_path(json_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encode(raw, source_stat))
+    os.replace(tmp_path, path)
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", nargs="?", default=EFFECTS_PATH)
+    parser.add_argument(
+        "--check", action="store_true", help="Only report whether it is current"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        with open(args.path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        current = load_if_current(args.path, digest)
+        if current is None:
+            print(f"✗ {columnar_path(args.path)} is missing or stale")
+            return 1
+        current.close()
+        print(f"✓ {columnar_path(args.path)} is current")
+        return 0
+
+    written = build(args.path)
+    target = columnar_path(args.path)
+    if written:
+        print(
+            f"✓ Wrote {target} ({os.path.getsize(target):,} bytes, "
+            f"JSON {os.path.getsize(args.path):,} bytes)"
+        )
+    else:
+        print(f"· {target} is up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Shared in-process store for the effects dataset.
+Loads effects.json (through its columnar copy when current) once and
+hot-reloads it when the file changes on disk.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import List, Dict, Any, Optional, Sequence
+from export.columnar import ColumnarDataset, load_if_current, load_if_unchanged
+from export.search_index import SearchIndex
+
+
+class DatasetSnapshot:
+    """effects.json at one specific file version. Treat as read-only.
+
+    Backed by the columnar file (export/columnar.py) when it was built from
+    this version of the JSON: `effects` is then a lazy sequence that decodes
+    an effect only when it is accessed, and `column()` reads one field of
+    every effect without building the others. Otherwise the JSON is parsed
+    on first access.
+    """
+
+    def __init__(
+        self,
+        mtime_ns: int,
+        size: int,
+        content_hash: str,
+        columnar: Optional[ColumnarDataset] = None,
+        raw: Optional[bytes] = None,
+    ):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        # Content hash doubles as a stable dataset version for cache keys
+        self.content_hash = content_hash
+        self.version = content_hash[:16]
+        self.columnar = columnar
+        self._raw = raw
+        self._data = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._parse_lock = threading.Lock()
+        self._search_index = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The full dataset ({"schemaVersion": ..., "effects": [...]}).
+
+        Decodes every effect; prefer `effects` and `column()`.
+        """
+        if self._data is None:
+            with self._parse_lock:
+                if self._data is None:
+                    if self.columnar is not None:
+                        self._data = {
+                            **self.columnar.extra,
+                            "effects": self.columnar.to_list(),
+                        }
+                    else:
+                        self._data = json.loads(self._raw)
+                        self._raw = None
+        return self._data
+
+    @property
+    def effects(self) -> Sequence[Dict[str, Any]]:
+        """Every effect in dataset order (decoded lazily if columnar)."""
+        if self.columnar is not None:
+            return self.columnar
+        return self.data["effects"]
+
+    def column(self, name: str) -> List[Any]:
+        """One field of every effect, in dataset order. Cached; don't mutate."""
+        values = self._columns.get(name)
+        if values is None:
+            if self.columnar is not None:
+                values = self.columnar.column(name)
+            else:
+                values = [effect[name] for effect in self.effects]
+            values = self._columns.setdefault(name, values)
+        return values
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Search index for this snapshot, built from its columns on first use."""
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.effects, self.column)
+        return self._search_index
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Return True if the stat result describes the file this was loaded from."""
+        return (
+            self.mtime_ns == stat_result.st_mtime_ns
+            and self.size == stat_result.st_size
+        )
+
+
+class DatasetStore:
+    """Process-wide holder of the current effects dataset snapshot.
+
+    Every `get()` does a single `os.stat` and returns the cached snapshot
+    while mtime and size are unchanged. When the file changes, a new
+    snapshot is parsed and swapped in under a lock; readers holding the old
+    snapshot keep using it untouched.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._loads = 0
+        self._checks = 0
+
+    def get(self) -> DatasetSnapshot:
+        """Return the current snapshot, reloading if the file changed."""
+        stat_result = os.stat(self.path)
+        self._checks += 1
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.matches(stat_result):
+            return snapshot
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.matches(stat_result):
+                return snapshot
+
+            snapshot = self._load(stat_result)
+            self._snapshot = snapshot
+            self._loads += 1
+            return snapshot
+
+    def _load(self, stat_result: os.stat_result) -> DatasetSnapshot:
+        """Build a snapshot, reading the JSON only if the columnar file is stale."""
+        mtime_ns, size = stat_result.st_mtime_ns, stat_result.st_size
+        columnar = load_if_unchanged(self.path, stat_result)
+        if columnar is not None:
+            return DatasetSnapshot(mtime_ns, size, columnar.source_sha256, columnar)
+
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        # Same content with a new mtime (e.g. after a checkout) still matches
+        columnar = load_if_current(self.path, content_hash)
+        if columnar is not None:
+            return DatasetSnapshot(mtime_ns, size, content_hash, columnar)
+        return DatasetSnapshot(mtime_ns, size, content_hash, raw=raw)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return load counters (loads should stay at 1 in steady state)."""
+        snapshot = self._snapshot
+        return {
+            "path": self.path,
+            "loads": self._loads,
+            "checks": self._checks,
+            "version": snapshot.version if snapshot else None,
+            "columnar": snapshot.columnar is not None if snapshot else None,
+        }
+
+
+_stores: Dict[str, DatasetStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path: str = "data/effects.json") -> DatasetStore:
+    """Return the shared store for a dataset path (one per absolute path)."""
+    key = os.path.abspath(path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(key, DatasetStore(path))
+    return store
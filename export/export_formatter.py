@@ -3,16 +3,32 @@ Export formatter with theme-aware styling.
 Handles CSV, XLSX, and JSON formatting.
 """
 
+import codecs
 import json
 import csv
 import io
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.cell.rich_text import TextBlock, CellRichText
 from openpyxl.cell.text import InlineFont
+from export.search_index import strip_html
+
+# Bump whenever rendered output changes, so pre-built files get rebuilt
+FORMATTER_VERSION = "1"
+
+# Characters buffered before a streamed CSV chunk is flushed
+CSV_CHUNK_SIZE = 16 * 1024
+
+BOLD_SPLIT_RE = re.compile(r"(<b>.*?</b>)")
+
+# XLSX cells with the same styles share one StyleArray through the private
+# cell._style (tested with openpyxl 3.1.5). If a later openpyxl drops it,
+# every cell falls back to the public font/fill/alignment/border setters.
+_SHARE_STYLE_ARRAYS = hasattr(WriteOnlyCell(None), "_style")
 
 
 class ExportFormatter:
@@ -46,10 +62,23 @@ class ExportFormatter:
         "source": 114,  # 910px ≈ 114 Excel units
     }
 
-    def __init__(self, theme: str):
-        """Initialize with theme (light or dark)."""
+    XLSX_ENGINES = ("write_only", "standard")
+
+    # Shared style objects per theme, built on first XLSX export
+    _THEME_STYLES: Dict[str, Dict[str, Any]] = {}
+
+    def __init__(self, theme: str, xlsx_engine: str = "write_only"):
+        """Initialize with theme (light or dark) and XLSX engine.
+
+        The "write_only" engine streams styled rows in a single pass; the
+        "standard" engine builds a full in-memory worksheet. Both produce the
+        same visible workbook.
+        """
         self.theme = theme.lower()
         self.colors = self.THEME_COLORS[self.theme]
+        if xlsx_engine not in self.XLSX_ENGINES:
+            raise ValueError(f"Unsupported XLSX engine: {xlsx_engine}")
+        self.xlsx_engine = xlsx_engine
 
     def format_json(self, effects: List[Dict[str, Any]]) -> str:
         """Format effects as JSON."""
@@ -58,10 +87,36 @@ class ExportFormatter:
     def format_csv(self, effects: List[Dict[str, Any]]) -> str:
         """Format effects as CSV."""
         output = io.StringIO()
-
-        headers = ["Mod", "Effect", "Max", "Description", "Tags", "Source"]
         writer = csv.writer(output)
-        writer.writerow(headers)
+        writer.writerows(self._csv_rows(effects))
+        return output.getvalue()
+
+    def format_csv_stream(
+        self, effects: Iterable[Dict[str, Any]], chunk_size: int = CSV_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Format effects as CSV, yielding UTF-8 encoded chunks.
+
+        The BOM (for Excel compatibility) is yielded first, then rows are
+        written one at a time and flushed whenever roughly chunk_size
+        characters have accumulated, so memory stays flat for any row count.
+        """
+        yield codecs.BOM_UTF8
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in self._csv_rows(effects):
+            writer.writerow(row)
+            if buffer.tell() >= chunk_size:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    def _csv_rows(self, effects: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+        """Yield the CSV header row followed by one row per effect."""
+        yield ["Mod", "Effect", "Max", "Description", "Tags", "Source"]
 
         for effect in effects:
             # Strip HTML from description and source for CSV
@@ -69,21 +124,182 @@ class ExportFormatter:
             source = self._strip_html(effect.get("source", ""))
             tags = ", ".join(effect["tags"])
 
-            writer.writerow(
+            yield [
+                effect["mod"],
+                effect["effect"],
+                effect["maxLevel"],
+                description,
+                tags,
+                source,
+            ]
+
+    def format_xlsx(self, effects: List[Dict[str, Any]]) -> bytes:
+        """Format effects as styled XLSX."""
+        if self.xlsx_engine == "write_only":
+            return self._format_xlsx_write_only(effects)
+        return self._format_xlsx_standard(effects)
+
+    def _format_xlsx_write_only(self, effects: List[Dict[str, Any]]) -> bytes:
+        """Format effects as styled XLSX in one streaming pass.
+
+        Uses a write-only workbook: each row is serialized as it is appended
+        and never kept as a cell grid. Every distinct cell style is resolved
+        once per workbook and shared by all cells that use it.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Status Effects")
+        styles = self._theme_styles()
+        style_arrays = {}
+
+        def styled(value, font, fill, alignment, border):
+            cell = WriteOnlyCell(ws, value=value)
+            key = (id(font), id(fill), id(alignment), id(border))
+            if _SHARE_STYLE_ARRAYS and key in style_arrays:
+                # Reuse the already registered style instead of re-adding
+                # each style object to the workbook for every cell
+                cell._style = style_arrays[key]
+                return cell
+            cell.font = font
+            cell.fill = fill
+            cell.alignment = alignment
+            cell.border = border
+            if _SHARE_STYLE_ARRAYS:
+                style_arrays[key] = cell._style
+            return cell
+
+        # Column widths must be set before any rows are written
+        self._set_column_widths(ws)
+
+        # Header row
+        headers = ["Mod", "Effect", "Max", "Description", "Tags", "Source"]
+        ws.row_dimensions[1].height = 20
+        ws.append(
+            [
+                styled(
+                    header.upper(),
+                    styles["header_font"],
+                    styles["header_fill"],
+                    styles["header_alignment"],
+                    styles["header_borders"][col],
+                )
+                for col, header in enumerate(headers, start=1)
+            ]
+        )
+
+        # Data rows
+        last_row = len(effects) + 1
+        for row_num, effect in enumerate(effects, start=2):
+            values = [
+                effect["mod"],
+                effect["effect"],
+                effect["maxLevel"],
+                self._html_to_rich_text(effect["description"]),
+                ", ".join(effect["tags"]),
+                self._html_to_rich_text(effect.get("source", "")),
+            ]
+            fill = styles["row_fills"][row_num % 2]
+            position = (row_num == 2, row_num == last_row)
+
+            ws.row_dimensions[row_num].height = 18
+            ws.append(
                 [
-                    effect["mod"],
-                    effect["effect"],
-                    effect["maxLevel"],
-                    description,
-                    tags,
-                    source,
+                    styled(
+                        value,
+                        styles["data_font"],
+                        fill,
+                        styles["column_alignments"][col],
+                        styles["data_borders"][position][col],
+                    )
+                    for col, value in enumerate(values, start=1)
                 ]
             )
 
+        # Save to bytes
+        output = io.BytesIO()
+        wb.save(output)
         return output.getvalue()
 
-    def format_xlsx(self, effects: List[Dict[str, Any]]) -> bytes:
-        """Format effects as styled XLSX."""
+    def _theme_styles(self) -> Dict[str, Any]:
+        """Return style objects for this theme, creating them once per process."""
+        styles = self._THEME_STYLES.get(self.theme)
+        if styles is not None:
+            return styles
+
+        colors = self.colors
+        col_count = 6
+        thin_border = Side(style="thin", color="000000")
+        medium_border = Side(style="medium", color="000000")
+
+        def side_borders(col):
+            return {
+                "left": thin_border if col > 1 else medium_border,
+                "right": medium_border if col == col_count else thin_border,
+            }
+
+        # Data borders keyed by (is first data row, is last data row) then column
+        data_borders = {}
+        for is_first in (True, False):
+            for is_last in (True, False):
+                data_borders[(is_first, is_last)] = {
+                    col: Border(
+                        **side_borders(col),
+                        top=None if is_first else thin_border,
+                        bottom=medium_border if is_last else thin_border,
+                    )
+                    for col in range(1, col_count + 1)
+                }
+
+        left = Alignment(horizontal="left", vertical="center", wrap_text=True)
+        center = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+        styles = {
+            "header_font": Font(
+                name="Arial", bold=True, color=colors["header_text"], size=10.5
+            ),
+            "header_fill": PatternFill(
+                start_color=colors["header_bg"],
+                end_color=colors["header_bg"],
+                fill_type="solid",
+            ),
+            "header_alignment": Alignment(horizontal="center", vertical="center"),
+            "header_borders": {
+                col: Border(
+                    **side_borders(col), top=medium_border, bottom=medium_border
+                )
+                for col in range(1, col_count + 1)
+            },
+            "data_font": Font(name="Arial", color=colors["text"], size=10),
+            # Keyed by row number parity, matching _style_data_row
+            "row_fills": {
+                parity: PatternFill(
+                    start_color=bg_color, end_color=bg_color, fill_type="solid"
+                )
+                for parity, bg_color in (
+                    (0, colors["row_bg_1"]),
+                    (1, colors["row_bg_2"]),
+                )
+            },
+            "column_alignments": {
+                1: left,
+                2: left,
+                3: center,
+                4: left,
+                5: center,
+                6: left,
+            },
+            "data_borders": data_borders,
+            "normal_inline_font": InlineFont(
+                rFont="Arial", color=colors["text"], sz=10
+            ),
+            "bold_inline_font": InlineFont(
+                rFont="Arial", color=colors["bold_text"], sz=10, b=True
+            ),
+        }
+        self._THEME_STYLES[self.theme] = styles
+        return styles
+
+    def _format_xlsx_standard(self, effects: List[Dict[str, Any]]) -> bytes:
+        """Format effects as styled XLSX using a regular in-memory workbook."""
         wb = Workbook()
         ws = wb.active
         ws.title = "Status Effects"
@@ -191,26 +407,29 @@ class ExportFormatter:
         if not cell.value:
             return
 
-        text = str(cell.value)
+        cell.value = self._html_to_rich_text(str(cell.value))
+
+    def _html_to_rich_text(self, text: str):
+        """Convert HTML text to rich text with bold runs, or plain stripped text."""
+        if not text:
+            return text
 
         # Check if there are any bold tags
         if "<b>" not in text:
             # No bold formatting needed, just strip any other HTML
-            cell.value = self._strip_html(text)
-            return
+            return self._strip_html(text)
 
         # Create rich text with bold formatting
         rich_text = CellRichText()
 
         # Split text by bold tags and process each part
-        parts = re.split(r"(<b>.*?</b>)", text)
+        parts = BOLD_SPLIT_RE.split(text)
 
-        # Regular font for normal text (using InlineFont for rich text)
-        normal_font = InlineFont(rFont="Arial", color=self.colors["text"], sz=10)
-        # Bold font with theme color for bold text
-        bold_font = InlineFont(
-            rFont="Arial", color=self.colors["bold_text"], sz=10, b=True
-        )
+        # Regular font for normal text and bold font with theme color
+        # for bold text (InlineFont is what rich text runs use)
+        styles = self._theme_styles()
+        normal_font = styles["normal_inline_font"]
+        bold_font = styles["bold_inline_font"]
 
         for part in parts:
             if part.startswith("<b>") and part.endswith("</b>"):
@@ -224,8 +443,7 @@ class ExportFormatter:
                 if clean_text:  # Only add if not empty
                     rich_text.append(TextBlock(normal_font, clean_text))
 
-        # Apply the rich text to the cell
-        cell.value = rich_text
+        return rich_text
 
     def _set_column_widths(self, ws):
         """Set column widths based on our table.css values."""
@@ -270,4 +488,4 @@ class ExportFormatter:
 
     def _strip_html(self, text: str) -> str:
         """Remove HTML tags from text."""
-        return re.sub(r"<[^>]+>", "", text)
+        return strip_html(text)
@@ -4,55 +4,73 @@ Handles filtering and theme-aware export generation.
 """
 
 import json
-import re
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from export.export_formatter import ExportFormatter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from export.dataset_store import get_store
+from export.export_formatter import FORMATTER_VERSION, ExportFormatter
+from export.export_pool import get_coalescer, get_process_pool
+from export.result_cache import get_result_cache
+from export.search_index import TAG_BITS
+from server.conditional import content_etag
+
+EXPORT_FORMATS = ("json", "csv", "xlsx")
+
+# Normalized filter tuple meaning "every effect"
+UNFILTERED = ("", 0, True)
 
 
 class ExportHandler:
     def __init__(self, effects_data_path: str = "data/effects.json"):
-        """Initialize with effects data."""
-        with open(effects_data_path, "r", encoding="utf-8") as f:
-            self.data = json.load(f)
-        self.effects = self.data["effects"]
+        """Initialize with effects data from the shared dataset store."""
+        self.store = get_store(effects_data_path)
+        self.snapshot = self.store.get()
+        self.effects = self.snapshot.effects
+        self.result_cache = get_result_cache()
 
-    def filter_effects(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Apply filters to effects data."""
-        filtered = self.effects.copy()
-
-        # Search filter
-        if search := filters.get("search", "").strip():
-            search_lower = search.lower()
-            filtered = [
-                effect
-                for effect in filtered
-                if (
-                    search_lower in effect["effect"].lower()
-                    or search_lower in effect["mod"].lower()
-                    or search_lower in self._strip_html(effect["description"]).lower()
-                )
-            ]
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The full dataset (decodes every effect; prefer self.effects)."""
+        return self.snapshot.data
+
+    def normalize_filters(
+        self, filters: Optional[Dict[str, Any]], ignore_filters: bool = False
+    ) -> Tuple[str, int, bool]:
+        """Reduce request filters to (search, excluded tag bits, include vanilla).
+
+        Equivalent filter sets map to the same tuple, and "no filters" maps to
+        UNFILTERED, so the result is usable as a cache key.
+        """
+        if ignore_filters or not filters:
+            return UNFILTERED
 
-        # Type filters
+        # Search filter (matching is case-insensitive)
+        search = filters.get("search", "").strip().lower()
+
+        # Type filters (a tag switched off excludes every effect carrying it)
         type_filters = filters.get("type_filters", {})
-        if type_filters.get("positive") is False:
-            filtered = [e for e in filtered if "positive" not in e["tags"]]
-        if type_filters.get("negative") is False:
-            filtered = [e for e in filtered if "negative" not in e["tags"]]
-        if type_filters.get("scaling") is False:
-            filtered = [e for e in filtered if "scaling" not in e["tags"]]
+        excluded_tags = 0
+        for tag, bit in TAG_BITS.items():
+            if type_filters.get(tag) is False:
+                excluded_tags |= bit
 
         # Vanilla filter
-        vanilla_filter = filters.get("vanilla_filter", True)
-        if vanilla_filter is False:
-            filtered = [e for e in filtered if e["mod"] != "Minecraft"]
+        include_vanilla = filters.get("vanilla_filter", True) is not False
+
+        return search, excluded_tags, include_vanilla
 
-        return filtered
+    def filter_effects(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Apply filters to effects data using the snapshot's search index."""
+        normalized = self.normalize_filters(filters)
+        if normalized == UNFILTERED:
+            return list(self.effects)
+        return self.snapshot.search_index.filter(*normalized)
 
-    def _strip_html(self, text: str) -> str:
-        """Remove HTML tags from text."""
-        return re.sub(r"<[^>]+>", "", text)
+    def filter_indexes(self, filters: Dict[str, Any]) -> List[int]:
+        """Like filter_effects, but return dataset indexes (decodes nothing)."""
+        normalized = self.normalize_filters(filters)
+        if normalized == UNFILTERED:
+            return list(range(len(self.effects)))
+        return self.snapshot.search_index.matching(*normalized)
 
     def export_data(
         self,
@@ -64,31 +82,186 @@ class ExportHandler:
         """
         Export data in specified format with theme styling.
 
+        Rendered content is served from the shared result cache when the same
+        dataset version, format, theme and normalized filters were seen before.
+
         Returns:
             tuple: (file_content as bytes, filename)
         """
-        if ignore_filters or not filters:
-            effects = self.effects
-        else:
-            effects = self.filter_effects(filters)
+        format_type = format_type.lower()
+        if format_type not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format_type}")
 
-        formatter = ExportFormatter(theme)
+        theme = theme.lower()
+        normalized = self.normalize_filters(filters, ignore_filters)
+        key = (self.snapshot.version, format_type, theme, normalized)
+
+        content = self.result_cache.get(key)
+        if content is None:
+            # Identical concurrent requests share one generation
+            content = get_coalescer().run(
+                key, lambda: self._generate(key, format_type, theme, normalized)
+            )
+
+        filename = self.export_filename(format_type)
+        return content, filename
+
+    def cached_export(
+        self,
+        format_type: str,
+        theme: str,
+        filters: Optional[Dict[str, Any]] = None,
+        ignore_filters: bool = False,
+    ) -> Optional[bytes]:
+        """Return already rendered content from the result cache, or None."""
+        normalized = self.normalize_filters(filters, ignore_filters)
+        key = (self.snapshot.version, format_type.lower(), theme.lower(), normalized)
+        return self.result_cache.get(key)
+
+    def cache_export(
+        self,
+        format_type: str,
+        theme: str,
+        filters: Optional[Dict[str, Any]],
+        ignore_filters: bool,
+        content: bytes,
+    ):
+        """Store content produced outside export_data (e.g. from shards)."""
+        normalized = self.normalize_filters(filters, ignore_filters)
+        key = (self.snapshot.version, format_type.lower(), theme.lower(), normalized)
+        self.result_cache.put(key, content)
+
+    def export_etag(
+        self,
+        format_type: str,
+        theme: str,
+        filters: Optional[Dict[str, Any]] = None,
+        ignore_filters: bool = False,
+    ) -> str:
+        """Return the ETag for an export, derived from what determines its content.
+
+        Hashing the rendered bytes would not do: XLSX files embed the time
+        they were saved, so every re-render would get a new ETag.
+        """
+        normalized = self.normalize_filters(filters, ignore_filters)
+        identity = json.dumps(
+            [
+                self.snapshot.content_hash,
+                FORMATTER_VERSION,
+                format_type.lower(),
+                theme.lower(),
+                list(normalized),
+            ]
+        )
+        return content_etag(identity.encode("utf-8"))
+
+    def export_filename(self, format_type: str) -> str:
+        """Return the timestamped download filename for a format."""
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        return f"status-effects-{timestamp}.{format_type.lower()}"
+
+    def export_stream(
+        self,
+        format_type: str,
+        theme: str,
+        filters: Optional[Dict[str, Any]] = None,
+        ignore_filters: bool = False,
+    ) -> tuple[Iterator[bytes], str]:
+        """
+        Export data as an iterator of byte chunks (CSV only).
+
+        Filtering happens before returning, so errors surface to the caller
+        rather than mid-stream. Cached content is yielded as-is; otherwise
+        rows are streamed and teed into the result cache if they fit.
+
+        Returns:
+            tuple: (iterator of file content chunks, filename)
+        """
+        format_type = format_type.lower()
+        if format_type != "csv":
+            raise ValueError(f"Streaming not supported for format: {format_type}")
+
+        theme = theme.lower()
+        normalized = self.normalize_filters(filters, ignore_filters)
+        key = (self.snapshot.version, format_type, theme, normalized)
+
+        filename = self.export_filename(format_type)
+
+        content = self.result_cache.get(key)
+        if content is not None:
+            return iter((content,)), filename
+
+        effects = self._effects_for(normalized)
+        chunks = ExportFormatter(theme).format_csv_stream(effects)
+        return self._tee_into_cache(key, chunks), filename
+
+    def _tee_into_cache(
+        self, key: Tuple[Any, ...], chunks: Iterator[bytes]
+    ) -> Iterator[bytes]:
+        """Yield chunks through, caching the joined result if it stays small."""
+        collected = []
+        size = 0
+        for chunk in chunks:
+            if collected is not None:
+                size += len(chunk)
+                if size <= self.result_cache.max_bytes:
+                    collected.append(chunk)
+                else:
+                    collected = None
+            yield chunk
+
+        if collected is not None:
+            self.result_cache.put(key, b"".join(collected))
+
+    def render_normalized(
+        self, format_type: str, theme: str, normalized: Tuple[str, int, bool]
+    ) -> bytes:
+        """Render effects matching already normalized filters, bypassing caches."""
+        return self._render(format_type, theme, self._effects_for(normalized))
+
+    def _generate(
+        self,
+        key: Tuple[Any, ...],
+        format_type: str,
+        theme: str,
+        normalized: Tuple[str, int, bool],
+    ) -> bytes:
+        """Render (in the process pool if configured) and store in the cache."""
+        pool = get_process_pool()
+        if pool is None:
+            content = self.render_normalized(format_type, theme, normalized)
+            self.result_cache.put(key, content)
+            return content
+
+        version, content = pool.render(format_type, theme, normalized)
+        # A hot reload may land between request and render. Such a result is
+        # still served, but not cached: filing it under another version would
+        # make the result cache purge everything for that version
+        if version == key[0]:
+            self.result_cache.put(key, content)
+        return content
+
+    def _effects_for(self, normalized: Tuple[str, int, bool]) -> List[Dict[str, Any]]:
+        """Return the effects selected by normalized filters."""
+        if normalized == UNFILTERED:
+            return self.effects
+        return self.snapshot.search_index.filter(*normalized)
+
+    def _render(
+        self, format_type: str, theme: str, effects: List[Dict[str, Any]]
+    ) -> bytes:
+        """Render effects in the given format without consulting the cache."""
+        formatter = ExportFormatter(theme)
 
-        if format_type.lower() == "json":
-            content = formatter.format_json(effects)
-            filename = f"status-effects-{timestamp}.json"
-            return content.encode("utf-8"), filename
+        if format_type == "json":
+            return formatter.format_json(effects).encode("utf-8")
 
-        elif format_type.lower() == "csv":
-            content = formatter.format_csv(effects)
-            filename = f"status-effects-{timestamp}.csv"
-            return content.encode("utf-8-sig"), filename  # BOM for Excel compatibility
+        elif format_type == "csv":
+            # BOM for Excel compatibility
+            return formatter.format_csv(effects).encode("utf-8-sig")
 
-        elif format_type.lower() == "xlsx":
-            content = formatter.format_xlsx(effects)
-            filename = f"status-effects-{timestamp}.xlsx"
-            return content, filename
+        elif format_type == "xlsx":
+            return formatter.format_xlsx(effects)
 
         else:
             raise ValueError(f"Unsupported format: {format_type}")
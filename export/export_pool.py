@@ -0,0 +1,171 @@
+"""
+Process pool and request coalescing for export generation.
+openpyxl holds the GIL, so XLSX (and JSON) rendering can run in worker
+processes that each keep the dataset loaded, while identical concurrent
+requests share a single computation. CSV never goes through the pool: it is
+cheap to format and is streamed row by row from the request thread
+(ExportHandler.export_stream), so memory stays flat for large exports.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class RequestCoalescer:
+    """Share one in-flight computation between identical concurrent requests.
+
+    The first caller for a key runs the computation; callers arriving while
+    it runs wait for the same result (or exception) instead of repeating it.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.coalesced = 0
+
+    def run(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return fn(), or the result of an identical call already running."""
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+                self.computed += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return how many calls ran versus piggybacked on another call."""
+        with self._lock:
+            return {
+                "computed": self.computed,
+                "coalesced": self.coalesced,
+                "inflight": len(self._inflight),
+            }
+
+
+def _init_worker(effects_path: str):
+    """Load the dataset (and its search index) once per worker process."""
+    from export.dataset_store import get_store
+
+    get_store(effects_path).get().search_index
+
+
+def _render_in_worker(
+    effects_path: str, format_type: str, theme: str, normalized: Tuple[str, int, bool]
+) -> Tuple[str, bytes]:
+    """Render an export in a worker; returns (dataset version, content)."""
+    from export.export_handler import ExportHandler
+
+    handler = ExportHandler(effects_path)
+    return handler.snapshot.version, handler.render_normalized(
+        format_type, theme, normalized
+    )
+
+
+class ProcessExportPool:
+    """Persistent pool of worker processes that render exports.
+
+    Workers are spawned (not forked) so they never inherit the server's
+    threads or locks, and each loads effects.json once at startup; later
+    edits are picked up through the dataset store's mtime check. A pool
+    broken by a crashed worker is replaced for the next render.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        effects_path: str = "data/effects.json",
+        timeout: Optional[float] = None,
+    ):
+        self.workers = workers
+        self.effects_path = effects_path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.effects_path,),
+        )
+
+    def render(
+        self, format_type: str, theme: str, normalized: Tuple[str, int, bool]
+    ) -> Tuple[str, bytes]:
+        """Render in a worker and wait for (dataset version, content).
+
+        Raises TimeoutError after `timeout` seconds and BrokenProcessPool if
+        a worker died; the caller reports both as "try again later".
+        """
+        with self._lock:
+            executor = self._executor
+        try:
+            future = executor.submit(
+                _render_in_worker, self.effects_path, format_type, theme, normalized
+            )
+            return future.result(timeout=self.timeout)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._new_executor()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def shutdown(self):
+        """Stop all worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_coalescer = RequestCoalescer()
+_process_pool: Optional[ProcessExportPool] = None
+
+
+def get_coalescer() -> RequestCoalescer:
+    """Return the process-wide request coalescer."""
+    return _coalescer
+
+
+def get_process_pool() -> Optional[ProcessExportPool]:
+    """Return the configured process pool, or None to render inline."""
+    return _process_pool
+
+
+def configure_process_pool(
+    workers: int,
+    effects_path: str = "data/effects.json",
+    timeout: Optional[float] = None,
+) -> Optional[ProcessExportPool]:
+    """Start (workers > 0) or stop (workers == 0) the shared process pool.
+
+    timeout bounds how long a render may take (None = wait indefinitely).
+    """
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+    if workers > 0:
+        _process_pool = ProcessExportPool(workers, effects_path, timeout)
+    return _process_pool
@@ -1,61 +1,332 @@
 """
 Pre-generate static export files for instant download.
-Run this script to create CSV, XLSX, and JSON files with all effects.
+Run this script to create CSV, XLSX, and JSON files with all effects, plus
+per-mod JSON/CSV row blocks (see export/shards.py) for filtered exports.
+
+A manifest records the effects.json content hash and formatter version each
+file was built from, so a run only rebuilds what changed and builds those
+files in parallel worker processes.
+
+Usage:
+    python -m export.generate_static
+    python -m export.generate_static --force --workers 2
 """
 
+import argparse
 import json
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from export.export_handler import ExportHandler
+from typing import List, Dict, Any, Optional, Tuple
+from export import columnar
+from export.dataset_store import get_store
+from export.export_formatter import FORMATTER_VERSION
+from export.export_handler import ExportHandler, UNFILTERED
+from export.shards import (
+    SHARD_DIR,
+    SHARD_FORMATS,
+    render_block,
+    shard_filename,
+    shard_plan,
+)
+from server.conditional import content_etag, file_etag
 
+EXPORT_DIR = "export/files"
+# {"dataset_hash", "formatter_version", "generated", "files": {filename: {...}}}
+MANIFEST_FILE = os.path.join(EXPORT_DIR, ".manifest.json")
+EFFECTS_PATH = "data/effects.json"
 
-def main():
-    """Generate pre-built export files."""
-    print("Generating pre-built export files...")
+THEMES = ["light", "dark"]
+FORMATS = ["json", "csv", "xlsx"]
 
-    # Ensure export directories exist
-    os.makedirs("export/files", exist_ok=True)
+_regen_lock = threading.Lock()
 
-    handler = ExportHandler()
 
-    # Generate files for both themes
-    themes = ["light", "dark"]
-    formats = ["json", "csv", "xlsx"]
+def static_filename(format_type: str, theme: str) -> str:
+    """Return the pre-built file name for a format/theme (JSON is theme-agnostic)."""
+    if format_type == "json":
+        return f"status-effects.{format_type}"
+    return f"status-effects-{theme}.{format_type}"
 
-    for theme in themes:
-        print(f"\nGenerating {theme} theme files...")
 
-        for format_type in formats:
-            try:
-                # Generate with no filters (all effects)
-                content, _ = handler.export_data(
-                    format_type, theme, ignore_filters=True
-                )
+def artifacts(
+    effects: List[Dict[str, Any]],
+) -> Dict[str, Tuple[str, str, Optional[str]]]:
+    """Return every pre-built file name mapped to (format, theme, shard).
+
+    shard is None for full export files; shard blocks are theme-agnostic.
+    """
+    targets = {}
+    for theme in THEMES:
+        for format_type in FORMATS:
+            targets.setdefault(
+                static_filename(format_type, theme), (format_type, theme, None)
+            )
+    for shard in shard_plan(effects):
+        for format_type in SHARD_FORMATS:
+            targets[shard_filename(shard, format_type)] = (format_type, None, shard)
+    return targets
+
+
+def load_manifest() -> Dict[str, Any]:
+    """Read the manifest, or return an empty one if missing or unreadable."""
+    try:
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def write_manifest(manifest: Dict[str, Any]):
+    """Atomically replace the manifest."""
+    tmp_path = MANIFEST_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, MANIFEST_FILE)
+
 
-                # Save with theme-specific name (JSON is theme-agnostic)
-                if format_type == "json":
-                    filename = f"status-effects.{format_type}"
-                else:
-                    filename = f"status-effects-{theme}.{format_type}"
+def is_current(
+    entry: Optional[Dict[str, Any]], filename: str, dataset_hash: str
+) -> bool:
+    """Return True if a manifest entry describes the file on disk and current inputs."""
+    if entry is None:
+        return False
+    if (
+        entry.get("dataset_hash") != dataset_hash
+        or entry.get("formatter_version") != FORMATTER_VERSION
+    ):
+        return False
+    try:
+        stat_result = os.stat(os.path.join(EXPORT_DIR, filename))
+    except OSError:
+        return False
+    return (
+        entry.get("size") == stat_result.st_size
+        and entry.get("mtime_ns") == stat_result.st_mtime_ns
+    )
 
-                filepath = os.path.join("export/files", filename)
 
-                # Write file
-                mode = "wb" if format_type == "xlsx" else "wb"
-                with open(filepath, mode) as f:
-                    f.write(content)
+def build_artifact(
+    filename: str, format_type: str, theme: Optional[str], shard: Optional[str]
+) -> Dict[str, Any]:
+    """Render one pre-built file and return its manifest entry.
 
+    Runs in a worker process. The entry records the dataset hash the worker
+    actually rendered, so an edit made mid-run leaves the file stale.
+    """
+    handler = ExportHandler(EFFECTS_PATH)
+    if shard is None:
+        content = handler.render_normalized(format_type, theme, UNFILTERED)
+    else:
+        effects = shard_plan(handler.effects).get(shard, [])
+        content = render_block(format_type, effects)
+
+    # Write next to the target and swap in, so downloads in progress never
+    # see a half-written file
+    filepath = os.path.join(EXPORT_DIR, filename)
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, filepath)
+
+    # Hash the bytes in hand so serving never re-reads the file
+    stat_result = os.stat(filepath)
+    return {
+        "etag": content_etag(content),
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+        "dataset_hash": handler.snapshot.content_hash,
+        "formatter_version": FORMATTER_VERSION,
+    }
+
+
+def generate_all(
+    verbose: bool = True, force: bool = False, workers: Optional[int] = None
+) -> bool:
+    """Build every missing or outdated pre-built file. Returns True if all succeeded.
+
+    Args:
+        verbose: Print one line per export file and a shard summary.
+        force: Rebuild even files the manifest says are up to date.
+        workers: Worker processes (default: one per outdated file, capped at
+            the CPU count). 1 builds in this process.
+    """
+    # Ensure export directories exist
+    os.makedirs(os.path.join(EXPORT_DIR, SHARD_DIR), exist_ok=True)
+
+    # Compact columnar copy of the dataset for fast loading. Optional: the
+    # store falls back to parsing the JSON, so a failure must not stop exports
+    try:
+        if columnar.build(EFFECTS_PATH) and verbose:
+            print(f"  ✓ Generated {columnar.columnar_path(EFFECTS_PATH)}")
+    except (OSError, ValueError, KeyError) as e:
+        print(f"  ✗ Skipped {columnar.columnar_path(EFFECTS_PATH)}: {e}")
+
+    snapshot = get_store(EFFECTS_PATH).get()
+    dataset_hash = snapshot.content_hash
+    targets = artifacts(snapshot.effects)
+    manifest = load_manifest()
+    files = manifest["files"]
+
+    pending: List[Tuple[str, str, Optional[str], Optional[str]]] = []
+    for filename, (format_type, theme, shard) in targets.items():
+        if not force and is_current(files.get(filename), filename, dataset_hash):
+            if verbose and shard is None:
+                print(f"  · {filename} is up to date")
+            continue
+        pending.append((filename, format_type, theme, shard))
+
+    ok = True
+    built_shards = 0
+    if pending:
+        workers = workers or min(len(pending), os.cpu_count() or 1)
+        for filename, result in _build_pending(pending, workers):
+            if isinstance(result, Exception):
+                ok = False
+                files.pop(filename, None)
+                print(f"  ✗ Failed to generate {filename}: {result}")
+                continue
+            files[filename] = result
+            if targets[filename][2] is not None:
+                built_shards += 1
+            elif verbose:
                 print(f"  ✓ Generated {filename}")
 
+    if verbose:
+        shard_count = sum(1 for spec in targets.values() if spec[2] is not None)
+        print(
+            f"  ✓ Shard blocks: {built_shards} built, {shard_count - built_shards} up to date"
+        )
+
+    # Drop files (e.g. shards of removed mods) no longer produced
+    for filename in set(files) - set(targets):
+        del files[filename]
+        try:
+            os.remove(os.path.join(EXPORT_DIR, filename))
+        except OSError:
+            pass
+
+    manifest.update(
+        dataset_hash=dataset_hash,
+        formatter_version=FORMATTER_VERSION,
+        generated=datetime.now().isoformat(),
+    )
+    write_manifest(manifest)
+    return ok
+
+
+def _build_pending(
+    pending: List[Tuple[str, str, Optional[str], Optional[str]]], workers: int
+):
+    """Yield (filename, manifest entry or exception) for each pending file."""
+    if workers <= 1:
+        for spec in pending:
+            try:
+                yield spec[0], build_artifact(*spec)
             except Exception as e:
-                print(f"  ✗ Failed to generate {theme} {format_type}: {e}")
+                yield spec[0], e
+        return
+
+    # Spawned (not forked) workers: this can run inside the threaded server
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(build_artifact, *spec): spec[0] for spec in pending}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
+
+
+_manifest_cache: Dict[str, Any] = {"mtime_ns": None, "manifest": {"files": {}}}
+
+
+def _cached_manifest() -> Dict[str, Any]:
+    """Return the manifest, re-reading it only when the file changes."""
+    try:
+        mtime_ns = os.stat(MANIFEST_FILE).st_mtime_ns
+    except OSError:
+        return {"files": {}}
+    if mtime_ns != _manifest_cache["mtime_ns"]:
+        _manifest_cache["manifest"] = load_manifest()
+        _manifest_cache["mtime_ns"] = mtime_ns
+    return _manifest_cache["manifest"]
+
+
+def is_fresh(filename: str) -> bool:
+    """Return True if a pre-built file exists and was built from the current dataset."""
+    dataset_hash = get_store(EFFECTS_PATH).get().content_hash
+    entry = _cached_manifest()["files"].get(filename)
+    return is_current(entry, filename, dataset_hash)
+
+
+def prebuilt_etag(filename: str) -> Optional[str]:
+    """Return the ETag of a pre-built file, or None if it doesn't exist.
+
+    Uses the hash recorded at generation time while the file's size and
+    mtime still match it; otherwise (hand-edited file, old run) the file is
+    hashed once and memoized.
+    """
+    filepath = os.path.join(EXPORT_DIR, filename)
+    try:
+        stat_result = os.stat(filepath)
+    except OSError:
+        return None
+
+    recorded = _cached_manifest()["files"].get(filename)
+    if (
+        recorded is not None
+        and recorded.get("size") == stat_result.st_size
+        and recorded.get("mtime_ns") == stat_result.st_mtime_ns
+    ):
+        return recorded["etag"]
+    return file_etag(filepath)
+
+
+def regenerate_in_background() -> bool:
+    """Start regenerating outdated files on a daemon thread.
+
+    Returns False without starting anything if a regeneration is already running.
+    """
+    if not _regen_lock.acquire(blocking=False):
+        return False
+
+    def worker():
+        try:
+            generate_all(verbose=False)
+        finally:
+            _regen_lock.release()
+
+    threading.Thread(target=worker, name="export-regenerate", daemon=True).start()
+    return True
+
+
+def main():
+    """Generate pre-built export files."""
+    parser = argparse.ArgumentParser(description="Pre-generate static export files.")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild files even if up to date"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per outdated file, up to CPU count)",
+    )
+    args = parser.parse_args()
+
+    print("Generating pre-built export files...")
 
-    # Update timestamp file
-    timestamp_file = "export/files/.generated"
-    with open(timestamp_file, "w") as f:
-        f.write(datetime.now().isoformat())
+    if not generate_all(force=args.force, workers=args.workers):
+        print("\n✗ Some files failed to generate")
+        raise SystemExit(1)
 
-    print(f"\n✓ All files generated successfully!")
+    print(f"\n✓ All files up to date!")
     print("Files are ready for instant download in export/files/")
 
 
@@ -0,0 +1,103 @@
+"""
+Byte-bounded LRU cache for rendered export files.
+Keys are (dataset version, format, theme, normalized filters), so any change
+to effects.json produces new keys and stale entries are purged on sight.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, Optional, Tuple
+
+# Roughly a few hundred XLSX exports of the current dataset
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 512
+
+
+class ExportResultCache:
+    """Thread-safe LRU mapping cache keys to rendered export bytes."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[bytes]:
+        """Return cached content for key (first element is the dataset version)."""
+        with self._lock:
+            self._check_version(key[0])
+            content = self._entries.get(key)
+            if content is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return content
+
+    def put(self, key: Tuple[Hashable, ...], content: bytes):
+        """Store content, evicting least recently used entries to fit the bounds."""
+        size = len(content)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._check_version(key[0])
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            self._entries[key] = content
+            self._bytes += size
+
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss metrics and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "version": self._version,
+            }
+
+    def _check_version(self, version: str):
+        """Purge everything when a key for a new dataset version shows up."""
+        if version == self._version:
+            return
+        if self._version is not None and self._entries:
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+        self._version = version
+
+
+_shared_cache = ExportResultCache()
+
+
+def get_result_cache() -> ExportResultCache:
+    """Return the process-wide export result cache."""
+    return _shared_cache
@@ -0,0 +1,95 @@
+"""
+Precomputed search index for export filtering.
+Built once per dataset snapshot so filtering never rebuilds strings per request.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Bit per filterable tag; an effect's tags are folded into one int
+TAG_BITS = {"positive": 1, "negative": 2, "scaling": 4}
+
+# Joins the searchable fields so one substring test covers all of them.
+# A control character never appears in queries, so matches can't span fields.
+_FIELD_SEP = "\x1f"
+
+
+def strip_html(text: str) -> str:
+    """Remove HTML tags from text."""
+    return HTML_TAG_RE.sub("", text)
+
+
+def tag_mask(tags) -> int:
+    """Fold a list of tag names into a TAG_BITS bitset."""
+    mask = 0
+    for tag in tags:
+        mask |= TAG_BITS.get(tag, 0)
+    return mask
+
+
+class SearchIndex:
+    """Lowercased, HTML-stripped search text plus tag bits for every effect.
+
+    Built from whole columns (`column(name)` returns one field of every
+    effect), so a columnar dataset never decodes effects to index them;
+    filter() only decodes the matches.
+    """
+
+    def __init__(
+        self,
+        effects: Sequence[Dict[str, Any]],
+        column: Optional[Callable[[str], List[Any]]] = None,
+    ):
+        if column is None:
+
+            def column(name):
+                return [effect[name] for effect in effects]
+
+        self.effects = effects
+        mods = column("mod")
+        self.effect_text = [name.lower() for name in column("effect")]
+        self.mod_text = [mod.lower() for mod in mods]
+        self.description_text = [
+            strip_html(description).lower() for description in column("description")
+        ]
+        self.haystacks = [
+            _FIELD_SEP.join(fields)
+            for fields in zip(self.effect_text, self.mod_text, self.description_text)
+        ]
+        self.tag_bits = [tag_mask(tags) for tags in column("tags")]
+        self.is_vanilla = [mod == "Minecraft" for mod in mods]
+
+    def matching(
+        self, search: str = "", excluded_tags: int = 0, include_vanilla: bool = True
+    ) -> List[int]:
+        """Return the indexes of effects matching the filters (see filter())."""
+        search_lower = search.lower()
+        haystacks = self.haystacks
+        tag_bits = self.tag_bits
+        is_vanilla = self.is_vanilla
+
+        return [
+            i
+            for i in range(len(haystacks))
+            if not (tag_bits[i] & excluded_tags)
+            and (include_vanilla or not is_vanilla[i])
+            and (not search_lower or search_lower in haystacks[i])
+        ]
+
+    def filter(
+        self, search: str = "", excluded_tags: int = 0, include_vanilla: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Return effects matching the search text and tag/vanilla exclusions.
+
+        Args:
+            search: Case-insensitive substring matched against effect, mod
+                and stripped description text. Empty matches everything.
+            excluded_tags: TAG_BITS mask; effects carrying any of them are dropped.
+            include_vanilla: If False, effects from mod 'Minecraft' are dropped.
+        """
+        effects = self.effects
+        return [
+            effects[i] for i in self.matching(search, excluded_tags, include_vanilla)
+        ]
@@ -0,0 +1,117 @@
+"""
+Pre-rendered JSON/CSV row blocks per mod (plus vanilla-only and modded-only).
+A filtered export that selects whole mods is assembled by concatenating
+blocks instead of formatting every effect again.
+"""
+
+import codecs
+import hashlib
+import json
+import re
+import textwrap
+from typing import List, Dict, Any, Optional, Sequence
+from export.export_formatter import ExportFormatter
+
+SHARD_DIR = "shards"
+SHARD_FORMATS = ("json", "csv")
+
+VANILLA_MOD = "Minecraft"
+VANILLA_SHARD = "vanilla"
+MODDED_SHARD = "modded"
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Pieces around the blocks, matching ExportFormatter.format_json /
+# format_csv byte for byte
+_JSON_HEAD = b'{\n  "effects": [\n'
+_JSON_SEP = b",\n"
+_JSON_TAIL = b"\n  ]\n}"
+
+
+def mod_shard(mod: str) -> str:
+    """Return the shard name holding one mod's effects."""
+    if mod == VANILLA_MOD:
+        return VANILLA_SHARD
+    slug = _SLUG_RE.sub("-", mod.lower()).strip("-")
+    # The hash keeps names unique when two mods slugify alike
+    digest = hashlib.sha1(mod.encode("utf-8")).hexdigest()[:8]
+    return f"mod-{slug}-{digest}"
+
+
+def shard_filename(shard: str, format_type: str) -> str:
+    """Return a shard's file name relative to the export directory."""
+    return f"{SHARD_DIR}/{shard}.{format_type}"
+
+
+def shard_plan(effects: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group effects into shards: one per mod, plus the modded-only union."""
+    plan: Dict[str, List[Dict[str, Any]]] = {MODDED_SHARD: []}
+    for effect in effects:
+        plan.setdefault(mod_shard(effect["mod"]), []).append(effect)
+        if effect["mod"] != VANILLA_MOD:
+            plan[MODDED_SHARD].append(effect)
+    return plan
+
+
+def render_block(format_type: str, effects: List[Dict[str, Any]]) -> bytes:
+    """Render effects as a bare block of JSON array items or CSV rows."""
+    if format_type == "json":
+        items = [
+            textwrap.indent(json.dumps(effect, indent=2, ensure_ascii=False), "    ")
+            for effect in effects
+        ]
+        return ",\n".join(items).encode("utf-8")
+
+    if format_type == "csv":
+        # The header row is skipped; assemble() adds it once
+        csv_text = ExportFormatter("light").format_csv(effects)
+        return csv_text.split("\r\n", 1)[1].encode("utf-8")
+
+    raise ValueError(f"Unsupported shard format: {format_type}")
+
+
+def assemble(format_type: str, blocks: List[bytes]) -> bytes:
+    """Join non-empty blocks into a complete export file."""
+    if format_type == "json":
+        return _JSON_HEAD + _JSON_SEP.join(blocks) + _JSON_TAIL
+
+    if format_type == "csv":
+        header = ExportFormatter("light").format_csv([]).encode("utf-8")
+        return codecs.BOM_UTF8 + header + b"".join(blocks)
+
+    raise ValueError(f"Unsupported shard format: {format_type}")
+
+
+def select_shards(
+    all_mods: Sequence[str], selected_mods: Sequence[str]
+) -> Optional[List[str]]:
+    """Return shards whose blocks concatenate to exactly the selected effects.
+
+    Takes the mod of every effect in dataset order and the mods of the
+    selected effects, so no effect has to be decoded. Works when the
+    selection consists of whole mods, each contiguous in the dataset (the
+    validated ordering guarantees this). Returns None for anything else,
+    including empty and complete selections.
+    """
+    if not selected_mods or len(selected_mods) == len(all_mods):
+        return None
+
+    mod_counts: Dict[str, int] = {}
+    mod_order: List[str] = []
+    for mod in all_mods:
+        if not mod_order or mod_order[-1] != mod:
+            if mod in mod_counts:
+                return None  # mod split across the dataset
+            mod_order.append(mod)
+        mod_counts[mod] = mod_counts.get(mod, 0) + 1
+
+    selected_counts: Dict[str, int] = {}
+    for mod in selected_mods:
+        selected_counts[mod] = selected_counts.get(mod, 0) + 1
+    if any(mod_counts[mod] != count for mod, count in selected_counts.items()):
+        return None
+
+    modded = [mod for mod in mod_order if mod != VANILLA_MOD]
+    if VANILLA_MOD not in selected_counts and len(selected_counts) == len(modded):
+        return [MODDED_SHARD]
+    return [mod_shard(mod) for mod in mod_order if mod in selected_counts]
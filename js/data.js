@@ -2,12 +2,42 @@
  * Data loading & bootstrap     *
  *------------------------------*/
 (function (MCSE) {
+  /**
+   * Rebuild effect objects from the columnar payload written by
+   * scripts/populate_html.py (data/effects.min.json). Dictionary-encoded
+   * fields hold indexes into payload.dicts[field]; tag arrays are shared
+   * between effects, so treat them as read-only.
+   */
+  MCSE.decodeEffectsPayload = function decodeEffectsPayload(payload) {
+    const { count, fields, dicts, columns } = payload;
+    const effects = new Array(count);
+    for (let i = 0; i < count; i++) {
+      const effect = {};
+      for (const field of fields) {
+        const value = columns[field][i];
+        effect[field] = dicts[field] ? dicts[field][value] : value;
+      }
+      effects[i] = effect;
+    }
+    return effects;
+  };
+
+  async function fetchJson(url) {
+    // Stable URL + "no-cache": the browser keeps its copy and revalidates
+    // with If-None-Match, so an unchanged dataset costs a 304, not a download.
+    const res = await fetch(url, { cache: "no-cache" });
+    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+    return res.json();
+  }
+
   MCSE.loadEffectsData = async function loadEffectsData() {
-    const jsonUrl = `data/effects.json?v=${Date.now()}`;
     try {
-      const res = await fetch(jsonUrl, { cache: "no-store" });
-      if (!res.ok) throw new Error(`HTTP ${res.status}`);
-      const json = await res.json();
+      return MCSE.decodeEffectsPayload(await fetchJson("data/effects.min.json"));
+    } catch (err) {
+      console.warn("Falling back to data/effects.json", err);
+    }
+    try {
+      const json = await fetchJson("data/effects.json");
       return json.effects || json;
     } catch (err) {
       console.error("Failed to fetch data/effects.json", err);
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Pool of long-lived Selenium WebDrivers shared by scraper threads.
+
+Starting Chrome costs far more than loading one mcmod.cn page, so drivers are
+started lazily (up to `size`), lent out one page at a time and reset between
+pages (cookies and web storage cleared, about:blank loaded). A driver is
+quit and replaced after `max_pages` pages, or as soon as a page raises,
+since a crashed or wedged browser is not worth reusing.
+
+Usage:
+    pool = BrowserPool(size=2, max_pages=50)
+    comments = extract_comments_with_selenium(url, browser_pool=pool)
+    pool.close()
+
+Run against the bundled fixture page (no network access needed):
+    python mcmod/browser_pool.py --pages 20 --size 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import pathlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+FIXTURES_DIR = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+# Cleared between pages so one page's session can't leak into the next
+_RESET_SCRIPT = "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+
+
+class PooledDriver:
+    """A driver plus the number of pages it has served."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class BrowserPool:
+    """Thread-safe pool of at most `size` WebDrivers."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages: int = 50,
+        driver_factory: Optional[Callable] = None,
+    ):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.max_pages = max_pages
+        self.driver_factory = driver_factory or _default_driver_factory
+        self._idle: List[PooledDriver] = []
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.started = 0
+        self.recycled = 0
+
+    @contextmanager
+    def borrow(self, timeout: Optional[float] = None) -> Iterator:
+        """Lend a driver for one page; blocks while all `size` drivers are busy."""
+        pooled = self._acquire(timeout)
+        try:
+            yield pooled.driver
+        except BaseException:
+            self._discard(pooled)
+            raise
+        pooled.pages += 1
+        if pooled.pages >= self.max_pages or not self._reset(pooled):
+            self._discard(pooled)
+            return
+        with self._cond:
+            if self._closed:
+                self._live -= 1
+                _quit(pooled)
+            else:
+                self._idle.append(pooled)
+            self._cond.notify()
+
+    def _acquire(self, timeout: Optional[float]) -> PooledDriver:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._live < self.size:
+                    self._live += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No browser became available")
+                self._cond.wait(remaining)
+
+        # Start the browser outside the lock; other threads keep borrowing
+        try:
+            driver = self.driver_factory()
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.started += 1
+        return PooledDriver(driver)
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """Clear per-page state. Returns False if the driver didn't respond."""
+        try:
+            pooled.driver.delete_all_cookies()
+            pooled.driver.execute_script(_RESET_SCRIPT)
+            pooled.driver.get("about:blank")
+        except Exception:
+            return False
+        return True
+
+    def _discard(self, pooled: PooledDriver):
+        _quit(pooled)
+        with self._cond:
+            self._live -= 1
+            self.recycled += 1
+            self._cond.notify()
+
+    def close(self):
+        """Quit idle drivers now; drivers still lent out are quit on return."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            _quit(pooled)
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _quit(pooled: PooledDriver):
+    try:
+        pooled.driver.quit()
+    except Exception:
+        pass
+
+
+def _default_driver_factory():
+    from scrape_effect import new_chrome_driver
+
+    return new_chrome_driver()
+
+
+@contextmanager
+def fixture_server(directory: pathlib.Path = FIXTURES_DIR) -> Iterator[str]:
+    """Serve a directory of HTML fixtures on localhost; yields the base URL."""
+
+    class QuietHandler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    handler = functools.partial(QuietHandler, directory=str(directory))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: List[str]) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+    from scrape_effect import SELENIUM_AVAILABLE, extract_comments_with_selenium
+
+    parser = argparse.ArgumentParser(
+        description="Scrape the local fixture page repeatedly through a BrowserPool."
+    )
+    parser.add_argument("--pages", type=int, default=10, help="Page loads")
+    parser.add_argument("--size", type=int, default=2, help="Browsers in the pool")
+    parser.add_argument(
+        "--max-pages", type=int, default=50, help="Recycle a browser after N pages"
+    )
+    args = parser.parse_args(argv[1:])
+
+    if not SELENIUM_AVAILABLE:
+        print("Error: Selenium is not installed", file=sys.stderr)
+        return 2
+
+    with fixture_server() as base_url, BrowserPool(args.size, args.max_pages) as pool:
+        url = f"{base_url}/effect_page.html"
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=args.size) as executor:
+            results = list(
+                executor.map(
+                    lambda _: extract_comments_with_selenium(url, browser_pool=pool),
+                    range(args.pages),
+                )
+            )
+        elapsed = time.monotonic() - started
+
+    empty = sum(1 for comments in results if not comments)
+    print(
+        f"{args.pages} pages in {elapsed:.1f}s with {pool.started} browser start(s), "
+        f"{pool.recycled} recycled, {empty} page(s) without comments"
+    )
+    return 1 if empty else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""On-disk cache for fetched mcmod.cn pages and Selenium-rendered page sources.
+
+Layout (under the cache directory, mcmod/.http_cache by default):
+    blobs/<aa>/<sha256>           page bodies, content-addressed (stored once)
+    entries/<aa>/<key>.json       per URL: body hash, status, validators, age
+
+An entry younger than `ttl` seconds is served without a request. An older
+one is revalidated with If-None-Match / If-Modified-Since, and a 304 renews
+it. In offline mode nothing touches the network: every entry is served
+regardless of age, and a missing one raises CacheMiss. That lets parser
+changes be replayed over previously scraped pages.
+
+Usage:
+    cache = HttpCache(ttl=24 * 3600)
+    response = cache.get(url, session=session, headers=HEADERS, timeout=30)
+
+    python mcmod/http_cache.py            # show cache statistics
+    python mcmod/http_cache.py --clear    # delete the cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = pathlib.Path(__file__).resolve().parent / ".http_cache"
+DEFAULT_TTL = 24 * 3600
+
+# Response headers kept with a cached page
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a URL was never cached."""
+
+
+class HttpCache:
+    """Content-addressed page cache with TTL and conditional revalidation."""
+
+    def __init__(
+        self,
+        directory: pathlib.Path = DEFAULT_CACHE_DIR,
+        ttl: float = DEFAULT_TTL,
+        offline: bool = False,
+    ):
+        self.directory = pathlib.Path(directory)
+        self.ttl = ttl
+        self.offline = offline
+        self._lock = threading.Lock()
+        self.counts = {"fresh": 0, "revalidated": 0, "downloaded": 0, "rendered": 0}
+
+    # Storage
+
+    def _entry_path(self, kind: str, url: str) -> pathlib.Path:
+        key = hashlib.sha256(f"{kind} {url}".encode("utf-8")).hexdigest()
+        return self.directory / "entries" / key[:2] / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> pathlib.Path:
+        return self.directory / "blobs" / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: pathlib.Path, content: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+
+    def _load(self, kind: str, url: str):
+        """Return (entry, body) or None if missing or unreadable."""
+        try:
+            entry = json.loads(self._entry_path(kind, url).read_text("utf-8"))
+            body = self._blob_path(entry["body"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry, body
+
+    def _store(self, kind: str, url: str, body: bytes, **fields: Any) -> Dict:
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            self._write_atomic(blob_path, body)
+        entry = dict(url=url, body=digest, fetched=time.time(), **fields)
+        self._save_entry(kind, url, entry)
+        return entry
+
+    def _save_entry(self, kind: str, url: str, entry: Dict):
+        self._write_atomic(
+            self._entry_path(kind, url), json.dumps(entry).encode("utf-8")
+        )
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        return self.offline or time.time() - entry.get("fetched", 0) < self.ttl
+
+    def _count(self, outcome: str):
+        with self._lock:
+            self.counts[outcome] += 1
+
+    # Fetched pages
+
+    def get(
+        self,
+        url: str,
+        session=None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+    ) -> requests.Response:
+        """GET url through the cache. Only 200 responses are cached."""
+        cached = self._load("page", url)
+        if cached is not None and self._is_fresh(cached[0]):
+            self._count("fresh")
+            return self._response(url, *cached)
+        if self.offline:
+            raise CacheMiss(f"Not in cache (offline): {url}")
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            entry = cached[0]
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = (session or requests).get(
+            url, headers=request_headers, timeout=timeout
+        )
+        if response.status_code == 304 and cached is not None:
+            entry, body = cached
+            entry["fetched"] = time.time()
+            self._save_entry("page", url, entry)
+            self._count("revalidated")
+            return self._response(url, entry, body)
+
+        if response.status_code == 200:
+            self._store(
+                "page",
+                url,
+                response.content,
+                status=200,
+                headers={
+                    name: response.headers[name]
+                    for name in _KEPT_HEADERS
+                    if name in response.headers
+                },
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            self._count("downloaded")
+        return response
+
+    @staticmethod
+    def _response(url: str, entry: Dict, body: bytes) -> requests.Response:
+        """Rebuild a requests.Response from a cache entry."""
+        response = requests.Response()
+        response.status_code = entry.get("status", 200)
+        response._content = body
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    # Rendered (browser) page sources
+
+    def get_rendered(self, url: str) -> Optional[str]:
+        """Return a cached rendered page source, or None if missing or stale.
+
+        An empty string means the page was rendered and had no comments.
+        """
+        cached = self._load("rendered", url)
+        if cached is None or not self._is_fresh(cached[0]):
+            return None
+        self._count("rendered")
+        return cached[1].decode("utf-8")
+
+    def put_rendered(self, url: str, page_source: Optional[str]):
+        """Store a rendered page source (None: the page had no comments)."""
+        self._store("rendered", url, (page_source or "").encode("utf-8"))
+
+    def summary(self) -> str:
+        return (
+            f"HTTP cache: {self.counts['fresh']} fresh, "
+            f"{self.counts['revalidated']} revalidated, "
+            f"{self.counts['downloaded']} downloaded, "
+            f"{self.counts['rendered']} rendered pages reused"
+        )
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or clear the page cache.")
+    parser.add_argument("--dir", default=str(DEFAULT_CACHE_DIR), help="Cache directory")
+    parser.add_argument("--clear", action="store_true", help="Delete the cache")
+    args = parser.parse_args(argv[1:])
+    directory = pathlib.Path(args.dir)
+
+    if args.clear:
+        shutil.rmtree(directory, ignore_errors=True)
+        print(f"Cleared {directory}")
+        return 0
+
+    entries = list(directory.glob("entries/*/*.json"))
+    blobs = list(directory.glob("blobs/*/*"))
+    size = sum(path.stat().st_size for path in blobs)
+    print(f"{directory}: {len(entries)} entries, {len(blobs)} bodies, {size:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -5,14 +5,30 @@ Extracts effect information from item-text, table-scroll, and comment-floor sect
 
 Note: Comments are loaded dynamically via JavaScript, so this script uses Selenium
 to wait for them to load. You need Chrome/Chromium installed for this to work.
+
+Fetching is tiered: the static HTML is parsed first, and the browser is only
+used when it does not already contain the comments and the page data leaves
+the max level or effect type undecided. Pass --always-browser for the old
+behaviour.
+
+Pages and rendered page sources are cached on disk (see http_cache.py);
+--offline replays cached pages without network access, --no-cache bypasses
+the cache.
 """
 
+import argparse
 import requests
 import sys
 from bs4 import BeautifulSoup
 import re
 import json
+import threading
 import time
+from contextlib import nullcontext
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
 
 
 # Optional Selenium support for loading dynamic comments
@@ -212,18 +228,8 @@ def extract_comments(soup):
     return comments
 
 
-def extract_comments_with_selenium(url, timeout=10):
-    """Extract comments using Selenium to wait for JavaScript to load them
-
-    Optimized for speed with minimal wait times and disabled unnecessary features.
-    """
-    if not SELENIUM_AVAILABLE:
-        print(
-            "Warning: Selenium not available, skipping dynamic comment loading",
-            file=sys.stderr,
-        )
-        return []
-
+def new_chrome_driver():
+    """Start a headless Chrome tuned for fast page loads (no images, no GPU)."""
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -237,58 +243,161 @@ def extract_comments_with_selenium(url, timeout=10):
     chrome_options.add_argument(
         "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     )
+    return webdriver.Chrome(options=chrome_options)
+
 
+def load_comment_page(driver, url, timeout=10):
+    """Open url in driver and wait for comments to render.
+
+    Returns the rendered page source, or None if the page has no comments.
+    """
+    driver.get(url)
+
+    # Wait for the comment block to appear (reduced timeout)
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.get(url)
+        comment_block = WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "common-comment-block"))
+        )
 
-        # Wait for the comment block to appear (reduced timeout)
+        # Scroll to the comment block to trigger lazy loading
+        driver.execute_script("arguments[0].scrollIntoView(true);", comment_block)
+
+        # Wait for comment-floor with explicit check (faster than time.sleep)
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "comment-floor"))
+        )
+
+        # Check if comments are actually present
+        # If comment-floor exists but has no comment-row children, return immediately
         try:
-            comment_block = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "common-comment-block"))
+            # Wait briefly for at least one comment to appear
+            WebDriverWait(driver, 2).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "comment-row"))
             )
+            # Comments found, give them a moment to fully render
+            time.sleep(0.5)
+        except TimeoutException:
+            # No comments found after 2 seconds, return immediately
+            return None
 
-            # Scroll to the comment block to trigger lazy loading
-            driver.execute_script("arguments[0].scrollIntoView(true);", comment_block)
+    except TimeoutException:
+        print("Warning: Timed out waiting for comments to load", file=sys.stderr)
 
-            # Wait for comment-floor with explicit check (faster than time.sleep)
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "comment-floor"))
-            )
+    # Get the page source after JavaScript execution
+    return driver.page_source
 
-            # Check if comments are actually present
-            # If comment-floor exists but has no comment-row children, return immediately
-            try:
-                # Wait briefly for at least one comment to appear
-                WebDriverWait(driver, 2).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "comment-row"))
-                )
-                # Comments found, give them a moment to fully render
-                time.sleep(0.5)
-            except TimeoutException:
-                # No comments found after 2 seconds, return immediately with empty list
-                driver.quit()
-                return []
 
-        except TimeoutException:
-            print("Warning: Timed out waiting for comments to load", file=sys.stderr)
+def extract_comments_with_selenium(
+    url, timeout=10, browser_pool=None, cache=None, limiter=None
+):
+    """Extract comments using Selenium to wait for JavaScript to load them
 
-        # Get the page source after JavaScript execution
-        page_source = driver.page_source
-        driver.quit()
+    Optimized for speed with minimal wait times and disabled unnecessary features.
+    With a browser_pool (see browser_pool.py) a long-lived driver is borrowed
+    instead of starting and quitting Chrome for this page. With an HttpCache
+    a previously rendered page source is reused. With a limiter (a HostLimiter
+    from scrape_effects_batch.py) the page load takes one of the host's
+    request slots, like a static fetch.
+    """
+    if cache is not None:
+        page_source = cache.get_rendered(url)
+        if page_source is not None:
+            soup = BeautifulSoup(page_source, "html.parser")
+            return extract_comments(soup)
+        if cache.offline:
+            print(
+                f"Warning: No rendered page cached for {url} (offline)",
+                file=sys.stderr,
+            )
+            return []
 
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(page_source, "html.parser")
-        return extract_comments(soup)
+    if not SELENIUM_AVAILABLE:
+        print(
+            "Warning: Selenium not available, skipping dynamic comment loading",
+            file=sys.stderr,
+        )
+        return []
 
+    try:
+        with limiter.slot(url) if limiter is not None else nullcontext():
+            if browser_pool is not None:
+                with browser_pool.borrow() as driver:
+                    page_source = load_comment_page(driver, url, timeout)
+            else:
+                driver = new_chrome_driver()
+                try:
+                    page_source = load_comment_page(driver, url, timeout)
+                finally:
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
     except Exception as e:
         print(f"Warning: Error using Selenium: {e}", file=sys.stderr)
-        try:
-            driver.quit()
-        except:
-            pass
         return []
 
+    if cache is not None:
+        cache.put_rendered(url, page_source)
+    if page_source is None:
+        return []
+
+    # Parse with BeautifulSoup
+    soup = BeautifulSoup(page_source, "html.parser")
+    return extract_comments(soup)
+
+
+def analysis_is_decided(item_info, table_info):
+    """Return True if effect type and max level come from explicit page data.
+
+    determine_effect_type otherwise falls back to keyword guesses, and
+    determine_max_level to a default of 1. Neither reads the comments, so
+    loading them can't change the analysis; an undecided page only gets the
+    browser load so its comments are in the output for manual review.
+    """
+    classification = item_info.get("classification", "").lower()
+    type_decided = any(
+        word in classification for word in ("负面", "正面", "negative", "positive")
+    )
+    level_decided = any(
+        "等级" in key or "level" in key.lower() for row in table_info for key in row
+    )
+    return type_decided and level_decided
+
+
+class FetchStats:
+    """Thread-safe page counts and time spent per fetch tier."""
+
+    TIERS = {
+        "static-comments": "static HTML had comments",
+        "static-decided": "static HTML decided the analysis",
+        "static-only": "browser disabled or unavailable",
+        "browser": "browser needed",
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pages = {tier: 0 for tier in self.TIERS}
+        self.seconds = {tier: 0.0 for tier in self.TIERS}
+
+    def record(self, tier, seconds):
+        with self._lock:
+            self.pages[tier] += 1
+            self.seconds[tier] += seconds
+
+    def summary(self):
+        """Human-readable per-tier lines plus the number of browser loads avoided."""
+        lines = []
+        for tier, label in self.TIERS.items():
+            if self.pages[tier]:
+                average = self.seconds[tier] / self.pages[tier]
+                lines.append(
+                    f"{tier}: {self.pages[tier]} pages, {self.seconds[tier]:.1f}s "
+                    f"({average:.2f}s/page) - {label}"
+                )
+        avoided = self.pages["static-comments"] + self.pages["static-decided"]
+        lines.append(f"Browser page loads avoided: {avoided}")
+        return "\n".join(lines)
+
 
 def determine_max_level(table_info, item_info, comments):
     """Determine max level from various sources"""
@@ -364,23 +473,43 @@ def determine_effect_type(item_info, comments):
     return "negative"  # Most mod effects tend to be negative/debuffs
 
 
-def scrape_effect_page(url, use_selenium=True):
+def scrape_effect_page(
+    url,
+    use_selenium=True,
+    session=None,
+    browser_pool=None,
+    stats=None,
+    always_browser=False,
+    cache=None,
+    limiter=None,
+):
     """Main function to scrape an effect page
 
     Args:
         url: The URL of the effect page to scrape
         use_selenium: If True, use Selenium to load dynamic comments (recommended)
+        session: Optional requests.Session to reuse connections across pages
+        browser_pool: Optional BrowserPool to borrow a running browser from
+        stats: Optional FetchStats to record which tier served the page
+        always_browser: Load comments with Selenium even when the static HTML
+            has them or the analysis doesn't need them
+        cache: Optional HttpCache for the page and its rendered source
+        limiter: Optional HostLimiter that browser page loads go through
+            (static fetches are limited by the session itself)
     """
+    started = time.monotonic()
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=30)
+        if cache is not None:
+            response = cache.get(url, session=session, headers=HEADERS, timeout=30)
+        else:
+            response = (session or requests).get(url, headers=HEADERS, timeout=30)
         response.encoding = "utf-8"
 
         if response.status_code != 200:
-            print(f"Failed to fetch {url}: HTTP {response.status_code}")
+            print(
+                f"Failed to fetch {url}: HTTP {response.status_code}",
+                file=sys.stderr,
+            )
             return None
 
         soup = BeautifulSoup(response.text, "html.parser")
@@ -390,13 +519,21 @@ def scrape_effect_page(url, use_selenium=True):
         item_info = extract_item_text_info(soup)
         table_info = extract_table_info(soup)
 
-        # Try to load comments with Selenium (since they're loaded dynamically)
-        comments = []
-        if use_selenium and SELENIUM_AVAILABLE:
-            comments = extract_comments_with_selenium(url)
+        # Comments are usually loaded dynamically; only escalate to the
+        # browser if the static HTML lacks them and the analysis fell back
+        # to guesses, where they are needed for manual review
+        comments = extract_comments(soup)
+        if not (use_selenium and SELENIUM_AVAILABLE):
+            tier = "static-only"
+        elif comments and not always_browser:
+            tier = "static-comments"
+        elif analysis_is_decided(item_info, table_info) and not always_browser:
+            tier = "static-decided"
         else:
-            # Fallback: try static HTML parsing (likely won't work for dynamic comments)
-            comments = extract_comments(soup)
+            tier = "browser"
+            comments = extract_comments_with_selenium(
+                url, browser_pool=browser_pool, cache=cache, limiter=limiter
+            )
 
         # Determine max level and type
         max_level = determine_max_level(table_info, item_info, comments)
@@ -410,22 +547,47 @@ def scrape_effect_page(url, use_selenium=True):
             "table_info": table_info,
             "comments": comments,
             "analysis": {"max_level": max_level, "effect_type": effect_type},
+            "fetch_tier": tier,
         }
 
+        if stats is not None:
+            stats.record(tier, time.monotonic() - started)
+
         return result
 
     except Exception as e:
-        print(f"Error scraping {url}: {str(e)}")
+        print(f"Error scraping {url}: {str(e)}", file=sys.stderr)
         return None
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python scrape_effect.py <effect_url>")
-        sys.exit(1)
+    from http_cache import DEFAULT_TTL, HttpCache
+
+    parser = argparse.ArgumentParser(description="Scrape one mcmod.cn effect page.")
+    parser.add_argument("url", help="Effect page URL")
+    parser.add_argument(
+        "--always-browser",
+        action="store_true",
+        help="Load comments with the browser even when the static HTML suffices",
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use cached pages (no network)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the cache")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds before a cached page is revalidated",
+    )
+    args = parser.parse_args()
 
-    url = sys.argv[1]
-    result = scrape_effect_page(url)
+    cache = None
+    if not args.no_cache:
+        cache = HttpCache(ttl=args.cache_ttl, offline=args.offline)
+    result = scrape_effect_page(
+        args.url, always_browser=args.always_browser, cache=cache
+    )
 
     if result:
         # Pretty print the result
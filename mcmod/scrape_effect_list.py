@@ -17,9 +17,14 @@ Behavior:
        - Lowercase everything
        Example: "Eidolon: Repraised" -> eidolon_repraised.txt
     6. Save one URL per line to mcmod/<mod_name>.txt.
+
+The list page is fetched through the on-disk page cache (http_cache.py):
+pass --offline to re-parse a cached page without network access, or
+--no-cache to bypass it.
 """
 from __future__ import annotations
 
+import argparse
 import re
 import sys
 import pathlib
@@ -28,6 +33,8 @@ from typing import Iterable
 import requests
 from bs4 import BeautifulSoup
 
+from http_cache import DEFAULT_TTL, HttpCache
+
 BASE = "https://www.mcmod.cn"
 HREF_RE = re.compile(r"^/item/(\d+)\.html$")
 PREFIX_RE = re.compile(r"^\[[^\]]+\]\s*")  # matches [XXX] prefix
@@ -175,8 +182,11 @@ def collect_item_links(soup: BeautifulSoup) -> list[str]:
     return sorted(links, key=lambda u: int(re.search(r"(\d+)", u).group(1)))
 
 
-def scrape(url: str) -> tuple[str, list[str]]:
-    resp = requests.get(url, timeout=15)
+def scrape(url: str, cache: HttpCache | None = None) -> tuple[str, list[str]]:
+    if cache is not None:
+        resp = cache.get(url, timeout=15)
+    else:
+        resp = requests.get(url, timeout=15)
     resp.raise_for_status()
     soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -201,12 +211,28 @@ def write_output(mod_name: str, links: Iterable[str]) -> pathlib.Path:
 
 
 def main(argv: list[str]) -> int:
-    if len(argv) != 2:
-        print("Usage: python mcmod/scrape_effect_list.py <list_url>", file=sys.stderr)
-        return 1
-    url = argv[1].strip()
+    parser = argparse.ArgumentParser(
+        description="Collect effect page URLs from an mcmod.cn list page."
+    )
+    parser.add_argument("list_url", help="List page URL")
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use cached pages (no network)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the cache")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds before a cached page is revalidated",
+    )
+    args = parser.parse_args(argv[1:])
+
+    url = args.list_url.strip()
+    cache = None
+    if not args.no_cache:
+        cache = HttpCache(ttl=args.cache_ttl, offline=args.offline)
     try:
-        mod_name, links = scrape(url)
+        mod_name, links = scrape(url, cache)
     except Exception as e:  # noqa: BLE001 simple cli
         print(f"Error: {e}", file=sys.stderr)
         return 2
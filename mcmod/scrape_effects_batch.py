@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Scrape many mcmod.cn effect pages concurrently and write JSON Lines.
+
+Usage:
+    python mcmod/scrape_effects_batch.py mcmod/effect_urls/apotheosis.txt
+    python mcmod/scrape_effects_batch.py mcmod/effect_urls/*.txt -o effects.jsonl
+    python mcmod/scrape_effects_batch.py urls.txt --workers 8 --per-host 2 --no-selenium
+    python mcmod/scrape_effects_batch.py urls.txt --browsers 3 --recycle-after 40
+
+Behavior:
+    1. Read URL files (one URL per line, as written by scrape_effect_list.py),
+       skipping blank lines, '#' comments and duplicates.
+    2. Scrape pages on a thread pool with scrape_effect.scrape_effect_page,
+       sharing one keep-alive requests.Session and, for dynamic comments, a
+       pool of --browsers long-lived Chrome instances (browser_pool.py).
+    3. Limit every host to --per-host requests in flight, started at least
+       --min-interval seconds apart (rate limiting for mcmod.cn). Browser
+       page loads count against the same limit as static fetches.
+    4. Write one JSON object per page as soon as it finishes (completion
+       order): the scrape result, or {"url": ..., "error": ...} on failure.
+    5. Print how many pages each fetch tier served (static HTML vs browser,
+       see scrape_effect.py) and the time spent in each.
+    6. Exit 0 if every page was scraped, 1 if any failed.
+
+Pages and rendered page sources go through the on-disk cache (http_cache.py):
+reruns within --cache-ttl seconds make no requests, older pages are
+revalidated, and --offline replays the cache without any network access.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from browser_pool import BrowserPool
+from http_cache import DEFAULT_TTL, HttpCache
+from scrape_effect import (
+    HEADERS,
+    SELENIUM_AVAILABLE,
+    FetchStats,
+    scrape_effect_page,
+)
+
+
+class HostLimiter:
+    """Per-host concurrency and request-start rate limits, shared by threads."""
+
+    def __init__(self, max_concurrent: int = 2, min_interval: float = 0.5):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.Semaphore] = {}
+        self._start_locks: Dict[str, threading.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Hold one of the host's request slots, waiting out the start interval."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.Semaphore(self.max_concurrent)
+                self._start_locks[host] = threading.Lock()
+                self._next_start[host] = 0.0
+            semaphore = self._slots[host]
+            start_lock = self._start_locks[host]
+
+        with semaphore:
+            # Serialize request starts per host so they are spaced out
+            with start_lock:
+                delay = self._next_start[host] - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                self._next_start[host] = time.monotonic() + self.min_interval
+            yield
+
+
+class LimitedSession(requests.Session):
+    """Keep-alive session whose requests go through a HostLimiter.
+
+    The connection pool holds one connection per worker thread, and
+    transient errors (429, 5xx) are retried with backoff.
+    """
+
+    def __init__(self, limiter: HostLimiter, pool_size: int):
+        super().__init__()
+        self.limiter = limiter
+        self.headers.update(HEADERS)
+        retries = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=pool_size, max_retries=retries
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        with self.limiter.slot(url):
+            return super().request(method, url, *args, **kwargs)
+
+
+def read_url_files(paths: Iterable[str]) -> List[str]:
+    """Return the URLs listed in the files, in order and without duplicates."""
+    urls: Dict[str, None] = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                url = line.strip()
+                if url and not url.startswith("#"):
+                    urls.setdefault(url, None)
+    return list(urls)
+
+
+def scrape_all(
+    urls: List[str],
+    out,
+    workers: int = 4,
+    per_host: int = 2,
+    min_interval: float = 0.5,
+    use_selenium: bool = True,
+    browsers: int = 2,
+    recycle_after: int = 50,
+    always_browser: bool = False,
+    cache: HttpCache | None = None,
+) -> int:
+    """Scrape every URL, writing one JSON line per page. Returns the failure count."""
+    limiter = HostLimiter(per_host, min_interval)
+    session = LimitedSession(limiter, pool_size=workers)
+    browser_pool = None
+    if use_selenium and SELENIUM_AVAILABLE and not (cache and cache.offline):
+        browser_pool = BrowserPool(size=browsers, max_pages=recycle_after)
+    stats = FetchStats()
+    failures = 0
+    started = time.monotonic()
+
+    try:
+        with session, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    scrape_effect_page,
+                    url,
+                    use_selenium,
+                    session,
+                    browser_pool,
+                    stats,
+                    always_browser,
+                    cache,
+                    limiter,
+                ): url
+                for url in urls
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                try:
+                    result = future.result()
+                # One bad page must not stop the batch
+                except Exception as e:  # noqa: BLE001
+                    result = None
+                    error = str(e)
+                else:
+                    error = "scrape failed"
+
+                if result is None:
+                    failures += 1
+                    result = {"url": url, "error": error}
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+                status = "✗" if "error" in result else "✓"
+                print(f"[{done}/{len(urls)}] {status} {url}", file=sys.stderr)
+    finally:
+        if browser_pool is not None:
+            browser_pool.close()
+
+    elapsed = time.monotonic() - started
+    print(
+        f"Scraped {len(urls) - failures}/{len(urls)} pages in {elapsed:.1f}s "
+        f"({failures} failed)",
+        file=sys.stderr,
+    )
+    print(stats.summary(), file=sys.stderr)
+    if cache is not None:
+        print(cache.summary(), file=sys.stderr)
+    return failures
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="Scrape mcmod.cn effect pages listed in URL files."
+    )
+    parser.add_argument("url_files", nargs="+", help="Files with one URL per line")
+    parser.add_argument(
+        "-o", "--output", default="-", help="JSON Lines output file (default: stdout)"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Pages in parallel")
+    parser.add_argument(
+        "--per-host", type=int, default=2, help="Max concurrent requests per host"
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=0.5,
+        help="Min seconds between request starts per host",
+    )
+    parser.add_argument(
+        "--no-selenium",
+        action="store_true",
+        help="Parse comments from the static HTML only",
+    )
+    parser.add_argument(
+        "--browsers", type=int, default=2, help="Chrome instances kept running"
+    )
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        default=50,
+        help="Restart a browser after this many pages",
+    )
+    parser.add_argument(
+        "--always-browser",
+        action="store_true",
+        help="Load comments with the browser even when the static HTML suffices",
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Only use cached pages (no network)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the cache")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds before a cached page is revalidated",
+    )
+    args = parser.parse_args(argv[1:])
+
+    try:
+        urls = read_url_files(args.url_files)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not urls:
+        print("Error: no URLs found", file=sys.stderr)
+        return 2
+
+    cache = None
+    if not args.no_cache:
+        cache = HttpCache(ttl=args.cache_ttl, offline=args.offline)
+    options = dict(
+        workers=args.workers,
+        per_host=args.per_host,
+        min_interval=args.min_interval,
+        use_selenium=not args.no_selenium,
+        browsers=args.browsers,
+        recycle_after=args.recycle_after,
+        always_browser=args.always_browser,
+        cache=cache,
+    )
+    if args.output == "-":
+        failures = scrape_all(urls, sys.stdout, **options)
+    else:
+        with open(args.output, "w", encoding="utf-8") as out:
+            failures = scrape_all(urls, out, **options)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
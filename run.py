@@ -1,13 +1,70 @@
 import os
 import sys
 import json
-from bottle import Bottle, static_file, run, HTTPError, redirect, request, response
-from export.export_handler import ExportHandler
+import argparse
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from bottle import (
+    Bottle,
+    ServerAdapter,
+    static_file,
+    run,
+    HTTPError,
+    redirect,
+    request,
+    response,
+)
+from export.export_handler import ExportHandler, UNFILTERED
+from export.export_pool import configure_process_pool
+from server.asset_store import AssetStore
+from server.conditional import (
+    not_modified_response,
+    validator_headers,
+)
+from server.file_response import SendfileRequestHandler, serve_file
+from server.fingerprint import IMMUTABLE_CACHE_CONTROL, is_fingerprinted
+from export.dataset_store import get_store
+from export.shards import SHARD_FORMATS, assemble, select_shards, shard_filename
+from export.generate_static import (
+    EFFECTS_PATH,
+    EXPORT_DIR,
+    THEMES,
+    is_fresh,
+    prebuilt_etag,
+    regenerate_in_background,
+    static_filename,
+)
 
 app = Bottle()
 
 ROOT_DIR = "."  # Public web root (keep sensitive files outside this if possible)
 
+# Seconds a request waits for a free export worker plus generation time
+EXPORT_TIMEOUT = float(os.environ.get("EXPORT_TIMEOUT", "60"))
+
+# Seconds a client is asked to wait when exports are saturated (503)
+EXPORT_RETRY_AFTER = 5
+
+# Bounded pool for CPU-heavy export generation (None = run inline).
+# Configured by the server mode in __main__.
+export_pool = None
+
+# Export requests admitted at once (None = unlimited). The calling HTTP thread
+# blocks while its export runs, so this is sized below the HTTP worker count:
+# further exports get an immediate 503 instead of tying up the threads that
+# serve pages and assets.
+export_slots = None
+
+EXPORT_MIMETYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
 # Files in the root directory we explicitly never want to serve
 SENSITIVE_ROOT_FILES = {
     "Dockerfile",
@@ -33,7 +90,10 @@ FORBIDDEN_DIRS = {
     "mcmod",
     "untracked",
     "export",
+    "server",
     "__pycache__",
+    "venv",
+    "node_modules",
 }
 
 
@@ -81,9 +141,43 @@ def is_forbidden_path(requested: str) -> bool:
     return False
 
 
+# In-memory copy of the public site with precompressed variants
+# (None = read from disk on every request). Enabled by --preload-assets.
+asset_store = None
+
+
+def serve_public_file(filename: str, etag: str = None, headers: dict = None):
+    """Serve a public file from the in-memory asset store, else from disk.
+
+    The asset store always uses content-hash ETags; etag overrides
+    static_file's default (path/mtime based) one.
+    """
+    if asset_store is not None:
+        cached = asset_store.serve(filename, request.environ, headers)
+        if cached is not None:
+            return cached
+    return static_file(
+        filename,
+        root=ROOT_DIR,
+        etag=f'"{etag}"' if etag else None,
+        headers=dict(headers) if headers else None,
+    )
+
+
 @app.route("/")
 def root():
-    return static_file("index.html", root=ROOT_DIR)
+    return serve_public_file("index.html")
+
+
+@app.route("/data/effects.json")
+def effects_data():
+    """Serve effects.json with a content-hash ETag so clients revalidate cheaply."""
+    snapshot = get_store(EFFECTS_PATH).get()
+    return serve_public_file(
+        "data/effects.json",
+        etag=snapshot.content_hash[:32],
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 @app.route("/sitemap.xml")
@@ -140,87 +234,437 @@ def export_effects(format_type):
             vanilla_filter = request.query.get("vanilla", "true").lower() == "true"
             filters["vanilla_filter"] = vanilla_filter
 
-        # Generate export
         handler = ExportHandler()
-        content, filename = handler.export_data(
-            format_type, theme, filters, ignore_filters
-        )
+        format_type = format_type.lower()
+
+        # Unfiltered (or equivalent) request: stream the pre-built file if fresh
+        if handler.normalize_filters(filters, ignore_filters) == UNFILTERED:
+            prebuilt = serve_prebuilt_export(format_type, theme.lower())
+            if prebuilt is not None:
+                return prebuilt
+
+        # The ETag identifies the export (dataset, formatter, format, theme,
+        # filters), so a repeat download is answered before rendering anything
+        if format_type in EXPORT_MIMETYPES:
+            etag = handler.export_etag(format_type, theme, filters, ignore_filters)
+            last_modified = handler.snapshot.mtime_ns / 1e9
+            not_modified = not_modified_response(request.environ, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            for name, value in validator_headers(etag, last_modified).items():
+                response.headers[name] = value
+
+        # Generate export (CSV is streamed row by row to keep memory flat,
+        # unless it is already rendered in the result cache or can be
+        # assembled from pre-built shards)
+        content = handler.cached_export(format_type, theme, filters, ignore_filters)
+        if content is None and not ignore_filters:
+            content = assemble_sharded_export(handler, format_type, filters)
+            if content is not None:
+                handler.cache_export(
+                    format_type, theme, filters, ignore_filters, content
+                )
+        if content is not None:
+            filename = handler.export_filename(format_type)
+        elif format_type == "csv":
+            content, filename = handler.export_stream(
+                format_type, theme, filters, ignore_filters
+            )
+        else:
+            content, filename = run_export(
+                handler.export_data, format_type, theme, filters, ignore_filters
+            )
 
         # Set appropriate headers
-        if format_type.lower() == "json":
-            response.content_type = "application/json"
-        elif format_type.lower() == "csv":
-            response.content_type = "text/csv"
-        elif format_type.lower() == "xlsx":
-            response.content_type = (
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+        if format_type in EXPORT_MIMETYPES:
+            response.content_type = EXPORT_MIMETYPES[format_type]
 
         response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
 
         return content
 
+    except (ExportBusy, FutureTimeoutError, BrokenProcessPool):
+        return export_busy_response()
     except Exception as e:
         return HTTPError(500, f"Export failed: {str(e)}")
 
 
+class ExportBusy(Exception):
+    """Raised when every export slot is taken."""
+
+
+def export_busy_response():
+    return HTTPError(
+        503,
+        "Export service busy, please try again",
+        headers={"Retry-After": str(EXPORT_RETRY_AFTER)},
+    )
+
+
+def run_export(fn, *args):
+    """Run an export call on the bounded export pool (inline if none).
+
+    Raises ExportBusy without waiting when all export slots are in use.
+    """
+    if export_pool is None:
+        return fn(*args)
+    if export_slots is not None and not export_slots.acquire(blocking=False):
+        raise ExportBusy()
+    try:
+        return export_pool.submit(fn, *args).result(timeout=EXPORT_TIMEOUT)
+    finally:
+        if export_slots is not None:
+            export_slots.release()
+
+
+def serve_prebuilt_export(format_type: str, theme: str):
+    """Return a file response for a fresh pre-built export, else None.
+
+    A missing or stale file kicks off background regeneration and the caller
+    falls back to dynamic generation for this request.
+    """
+    if format_type not in EXPORT_MIMETYPES or theme not in THEMES:
+        return None
+
+    filename = static_filename(format_type, theme)
+    etag = prebuilt_etag(filename) if is_fresh(filename) else None
+    if etag is None:
+        regenerate_in_background()
+        return None
+
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return serve_file(
+        os.path.join(EXPORT_DIR, filename),
+        request.environ,
+        etag=etag,
+        mimetype=EXPORT_MIMETYPES[format_type],
+        download=f"status-effects-{timestamp}.{format_type}",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def assemble_sharded_export(handler, format_type: str, filters: dict):
+    """Concatenate pre-built shard blocks for a whole-mod selection, else None.
+
+    Applies to JSON/CSV exports whose filters select complete mods (a mod
+    name search, vanilla switched off, ...). Stale shards kick off background
+    regeneration and the caller renders this request itself.
+    """
+    if format_type not in SHARD_FORMATS:
+        return None
+
+    mods = handler.snapshot.column("mod")
+    shards = select_shards(mods, [mods[i] for i in handler.filter_indexes(filters)])
+    if shards is None:
+        return None
+
+    blocks = []
+    for shard in shards:
+        filename = shard_filename(shard, format_type)
+        if not is_fresh(filename):
+            regenerate_in_background()
+            return None
+        try:
+            with open(os.path.join(EXPORT_DIR, filename), "rb") as f:
+                blocks.append(f.read())
+        except OSError:
+            return None
+    return assemble(format_type, blocks)
+
+
 @app.route("/export/static/<filename>")
 def serve_static_export(filename):
-    """Serve pre-generated export files."""
-    try:
-        return static_file(filename, root="export/files")
-    except:
+    """Serve pre-generated export files (with Range support for resuming)."""
+    format_type = os.path.splitext(filename)[1].lstrip(".")
+    if filename.startswith(".") or format_type not in EXPORT_MIMETYPES:
         return HTTPError(404, "Export file not found")
 
+    etag = prebuilt_etag(filename)
+    if etag is None:
+        return HTTPError(404, "Export file not found")
 
-@app.route("/<requested:path>")
-def serve_any(requested: str):
-    """Serve static assets with extensionless support.
+    return serve_file(
+        os.path.join(EXPORT_DIR, filename),
+        request.environ,
+        etag=etag,
+        mimetype=EXPORT_MIMETYPES[format_type],
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+# Outcomes of resolving a requested path in serve_any
+PATH_FORBIDDEN = "forbidden"
+PATH_FILE = "file"
+PATH_MISSING = "missing"
+
+
+class ResolvedPathCache:
+    """Bounded LRU of serve_any resolution decisions with a short TTL.
+
+    Maps a requested path to (PATH_FORBIDDEN | PATH_FILE | PATH_MISSING,
+    resolved file or None), so repeated asset hits skip the deny-rule checks
+    and isfile probes. The TTL bounds how long a newly added or removed file
+    can be reported with its old status.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl: float = 5.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, requested: str):
+        """Return the cached decision, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(requested)
+            if entry is None:
+                return None
+            expires, decision = entry
+            if expires < time.monotonic():
+                del self._entries[requested]
+                return None
+            self._entries.move_to_end(requested)
+            return decision
+
+    def put(self, requested: str, decision):
+        """Cache a decision, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[requested] = (time.monotonic() + self.ttl, decision)
+            self._entries.move_to_end(requested)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every decision (e.g. after deploying new files)."""
+        with self._lock:
+            self._entries.clear()
+
+
+path_cache = ResolvedPathCache(ttl=float(os.environ.get("STATIC_PATH_CACHE_TTL", "5")))
+
+
+def resolve_static_path(requested: str):
+    """Resolve a requested path to a (decision, file) pair.
 
     Resolution order (stop at first existing file):
       1. Exact path as-is (requested)
       2. As directory index (requested + '/index.html')
       3. As HTML file (requested + '.html')
-    Returns 404 if none match.
     """
 
-    # Security / deny rules (defense-in-depth). Return 403 for forbidden targets.
+    # Security / deny rules (defense-in-depth)
     if is_forbidden_path(requested):
-        return HTTPError(403, "Forbidden")
+        return PATH_FORBIDDEN, None
 
     # Direct file hit (includes assets and .html when explicitly requested)
     direct_path = os.path.join(ROOT_DIR, requested)
     if os.path.isfile(direct_path):
-        return static_file(requested, root=ROOT_DIR)
+        return PATH_FILE, requested
 
     # Directory index fallback
     idx_path = os.path.join(ROOT_DIR, requested, "index.html")
     if os.path.isfile(idx_path):
-        return static_file(os.path.join(requested, "index.html"), root=ROOT_DIR)
+        return PATH_FILE, os.path.join(requested, "index.html")
 
     # .html implicit fallback
     html_path = os.path.join(ROOT_DIR, requested + ".html")
     if os.path.isfile(html_path):
-        return static_file(requested + ".html", root=ROOT_DIR)
+        return PATH_FILE, requested + ".html"
+
+    return PATH_MISSING, None
 
-    return HTTPError(404, "Not Found")
+
+@app.route("/<requested:path>")
+def serve_any(requested: str):
+    """Serve static assets with extensionless support.
+
+    Resolution follows resolve_static_path, with decisions cached in
+    path_cache. Returns 403 for forbidden targets and 404 if none match.
+    Fingerprinted assets (see scripts/fingerprint_assets.py) are served
+    with an immutable, year-long Cache-Control.
+    """
+    resolved = path_cache.get(requested)
+    if resolved is None:
+        resolved = resolve_static_path(requested)
+        path_cache.put(requested, resolved)
+
+    decision, filename = resolved
+    if decision == PATH_FORBIDDEN:
+        return HTTPError(403, "Forbidden")
+    if decision == PATH_MISSING:
+        return HTTPError(404, "Not Found")
+
+    # Fingerprinted assets never change under the same name
+    if is_fingerprinted(filename):
+        return serve_public_file(
+            filename, headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        )
+    return serve_public_file(filename)
+
+
+class ThreadPoolServer(ServerAdapter):
+    """WSGIRef server that handles requests on a bounded thread pool.
+
+    Unlike the default single-threaded WSGIRefServer, one slow request no
+    longer blocks every other one. File downloads go out via os.sendfile.
+    Options: workers (pool size).
+    """
+
+    def run(self, handler):
+        from wsgiref.simple_server import WSGIServer, make_server
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.options.get("workers", 8), thread_name_prefix="http"
+        )
+
+        class PooledWSGIServer(WSGIServer):
+            def process_request(self, request, client_address):
+                pool.submit(self._process_in_pool, request, client_address)
+
+            def _process_in_pool(self, request, client_address):
+                try:
+                    self.finish_request(request, client_address)
+                except Exception:
+                    self.handle_error(request, client_address)
+                finally:
+                    self.shutdown_request(request)
+
+        class QuietHandler(SendfileRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        handler_class = QuietHandler if self.quiet else SendfileRequestHandler
+        srv = make_server(
+            self.host,
+            self.port,
+            handler,
+            server_class=PooledWSGIServer,
+            handler_class=handler_class,
+        )
+        try:
+            srv.serve_forever()
+        finally:
+            srv.server_close()
+            pool.shutdown(wait=False)
+
+
+def parse_args(argv):
+    """Parse CLI flags; every option falls back to an environment variable."""
+    parser = argparse.ArgumentParser(
+        description="Serve the Minecraft Status Effects website."
+    )
+    parser.add_argument(
+        "port", nargs="?", help="Port to listen on (env PORT, default 8000)"
+    )
+    parser.add_argument(
+        "--server",
+        default=os.environ.get("SERVER", "wsgiref"),
+        help="wsgiref (single-threaded dev server), threaded (bounded thread "
+        "pool), or any Bottle server adapter such as waitress or gunicorn "
+        "(env SERVER, default wsgiref)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WORKERS", "8")),
+        help="HTTP worker threads (threaded/waitress) or processes (gunicorn) "
+        "(env WORKERS, default 8)",
+    )
+    parser.add_argument(
+        "--export-processes",
+        type=int,
+        default=int(os.environ.get("EXPORT_PROCESSES", "0")),
+        help="Worker processes that render exports outside the server process "
+        "(env EXPORT_PROCESSES, default 0 = render in-process)",
+    )
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        default=int(os.environ.get("EXPORT_WORKERS", "2")),
+        help="Concurrent export generations when not using wsgiref "
+        "(env EXPORT_WORKERS, default 2)",
+    )
+    parser.add_argument(
+        "--export-slots",
+        type=int,
+        default=int(os.environ.get("EXPORT_SLOTS", "0")),
+        help="Export requests handled at once before answering 503; must stay "
+        "below --workers (env EXPORT_SLOTS, default 0 = half the workers)",
+    )
+    parser.add_argument(
+        "--preload-assets",
+        action="store_true",
+        default=os.environ.get("PRELOAD_ASSETS", "false").lower() == "true",
+        help="Hold public files in memory with gzip/brotli variants "
+        "(env PRELOAD_ASSETS=true)",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+
     # Accept optional port argument: python run.py [port]
     # Default to port 8000 if not provided
     default_port = 8000
-    if len(sys.argv) > 1:
+    if args.port is not None:
         try:
-            port = int(sys.argv[1])
+            port = int(args.port)
         except ValueError:
             print(
-                f"Error: Invalid port '{sys.argv[1]}'. Using default port {default_port}."
+                f"Error: Invalid port '{args.port}'. Using default port {default_port}."
             )
             port = default_port
     else:
         port = int(os.environ.get("PORT", default_port))
 
     debug = os.environ.get("DEBUG", "true").lower() == "true"
+
+    # Server mode: wsgiref keeps the original single-threaded behavior
+    server_options = {}
+    if args.server == "wsgiref":
+        server = "wsgiref"
+    else:
+        if args.server == "threaded":
+            server = ThreadPoolServer
+            server_options["workers"] = args.workers
+        elif args.server == "waitress":
+            server = args.server
+            server_options["threads"] = args.workers
+        elif args.server == "gunicorn":
+            server = args.server
+            server_options["workers"] = args.workers
+        else:
+            server = args.server
+
+    # With the reloader on, this process only watches files and restarts a
+    # child (marked by BOTTLE_CHILD) that does the serving; build pools and
+    # preload assets in the serving process only
+    serving = not debug or os.environ.get("BOTTLE_CHILD") == "true"
+
+    if serving and server != "wsgiref":
+        export_pool = ThreadPoolExecutor(
+            max_workers=args.export_workers, thread_name_prefix="export"
+        )
+        slots = args.export_slots or args.workers // 2
+        export_slots = threading.BoundedSemaphore(max(1, min(slots, args.workers - 1)))
+
+    if serving and args.preload_assets:
+        asset_store = AssetStore(ROOT_DIR, is_forbidden_path)
+        count, total = asset_store.preload()
+        print(f"Preloaded {count} public files ({total / 1024:.0f} KB) into memory")
+
+    # Render exports in worker processes (openpyxl is CPU-bound under the GIL)
+    if serving and args.export_processes > 0:
+        configure_process_pool(args.export_processes, timeout=EXPORT_TIMEOUT)
+
     # Disable reloader in production-like runs
-    run(app, host="0.0.0.0", port=port, debug=debug, reloader=debug)
+    run(
+        app,
+        server=server,
+        host="0.0.0.0",
+        port=port,
+        debug=debug,
+        reloader=debug,
+        **server_options,
+    )
@@ -10,6 +10,8 @@
 #   1. scripts/validate_effects.py (explicitly included if present)
 #   2. scripts/test_*.py           (pytest-like prefix pattern)
 #   3. scripts/*_test.py           (alternate suffix pattern)
+#   4. freshness checks of committed generated files
+#      (scripts/fingerprint_assets.py --check, scripts/populate_html.py --check)
 # Duplicate paths are de-duplicated in listed order.
 # To add new tests later, just drop a file following one of the patterns above
 # or pass it explicitly as an argument.
@@ -58,6 +60,14 @@ else
   shopt -u nullglob
 fi
 
+# Generated files are committed (deploys have no build step), so check they
+# still match their sources. Entries are "script args..." command lines.
+declare -a CHECKS=()
+if [ "$#" -eq 0 ]; then
+  if [ -f scripts/fingerprint_assets.py ]; then CHECKS+=("scripts/fingerprint_assets.py --check"); fi
+  if [ -f scripts/populate_html.py ]; then CHECKS+=("scripts/populate_html.py --check"); fi
+fi
+
 # De-duplicate while preserving order
 declare -A SEEN
 declare -a UNIQUE
@@ -74,8 +84,9 @@ if [ ${#TESTS[@]} -eq 0 ]; then
   exit 0
 fi
 
-echo -e "${BOLD}Discovered ${#TESTS[@]} test script(s):${RESET}"
-for t in "${TESTS[@]}"; do echo "  - $t"; done
+total=$(( ${#TESTS[@]} + ${#CHECKS[@]} ))
+echo -e "${BOLD}Discovered ${total} test script(s):${RESET}"
+for t in "${TESTS[@]}" "${CHECKS[@]}"; do echo "  - $t"; done
 echo
 
 failures=0
@@ -90,8 +101,20 @@ for t in "${TESTS[@]}"; do
   echo
 done
 
+for c in "${CHECKS[@]}"; do
+  echo -e "${BOLD}>>> Running:${RESET} $c"
+  # shellcheck disable=SC2086
+  if python $c; then
+    echo -e "${GREEN}PASS:${RESET} $c"
+  else
+    echo -e "${RED}FAIL:${RESET} $c"
+    failures=$((failures+1))
+  fi
+  echo
+done
+
 if [ $failures -eq 0 ]; then
-  echo -e "${GREEN}All tests passed (${#TESTS[@]}).${RESET}"
+  echo -e "${GREEN}All tests passed (${total}).${RESET}"
   exit 0
 else
   echo -e "${RED}$failures test(s) failed.${RESET}" >&2
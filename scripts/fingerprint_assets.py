@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Fingerprint static assets for long-lived browser caching.
+
+This script:
+1. Hashes every js/*.js and css/*.css source file
+2. Writes a fingerprinted copy next to it (e.g. js/render.3f9a1c07e2.js)
+   and removes copies left over from older versions
+3. Rewrites the <script src> / <link href> references in the HTML pages
+
+run.py serves fingerprinted files with an immutable Cache-Control header,
+so re-run this script whenever a js/css file changes (it is idempotent).
+With --check nothing is written; it lists stale copies and references and
+exits 1 if there are any (run_tests.sh runs it).
+
+Usage:
+    python scripts/fingerprint_assets.py
+    python scripts/fingerprint_assets.py --check
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from server.fingerprint import (  # noqa: E402
+    FINGERPRINT_EXTS,
+    FINGERPRINT_RE,
+    HASH_LENGTH,
+    fingerprint_name,
+    is_fingerprinted,
+)
+
+ASSET_DIRS = ["js", "css"]
+HTML_PAGES = ["index.html", "privacy-policy/index.html", "license/index.html"]
+
+# src="js/render.js", href="../css/legal.css" or an already fingerprinted form
+ASSET_REF_RE = re.compile(
+    r'(?P<attr>\b(?:src|href)=")(?P<prefix>(?:\.\./)*)'
+    r"(?P<dir>js|css)/(?P<stem>[\w.-]+?)(?:\.[0-9a-f]{%d})?(?P<ext>\.(?:js|css))\""
+    % HASH_LENGTH
+)
+
+
+def asset_sources():
+    """Yield (dirname, source path) for every asset that gets fingerprinted."""
+    for dirname in ASSET_DIRS:
+        asset_dir = ROOT / dirname
+        sources = sorted(
+            p
+            for p in asset_dir.iterdir()
+            if p.is_file()
+            and p.suffix in FINGERPRINT_EXTS
+            and not is_fingerprinted(p.name)
+        )
+        for source in sources:
+            yield dirname, source
+
+
+def old_copies(source, target):
+    """Fingerprinted copies of earlier versions of source."""
+    for path in source.parent.glob(f"{source.stem}.*{source.suffix}"):
+        match = FINGERPRINT_RE.match(path.name)
+        if path != target and match and match["stem"] == source.stem:
+            yield path
+
+
+def fingerprint_assets():
+    """Write fingerprinted copies; returns {'js/render.js': 'js/render.<hash>.js'}."""
+    manifest = {}
+    for dirname, source in asset_sources():
+        content = source.read_bytes()
+        target = source.parent / fingerprint_name(source.name, content)
+        if not target.exists():
+            target.write_bytes(content)
+
+        # Drop copies of earlier versions of this file
+        for stale in old_copies(source, target):
+            stale.unlink()
+
+        manifest[f"{dirname}/{source.name}"] = f"{dirname}/{target.name}"
+    return manifest
+
+
+def check_assets():
+    """Return the files that are out of date, without writing anything."""
+    manifest = {}
+    stale = []
+    for dirname, source in asset_sources():
+        content = source.read_bytes()
+        target = source.parent / fingerprint_name(source.name, content)
+        if not target.exists() or target.read_bytes() != content:
+            stale.append(f"{dirname}/{target.name} (missing)")
+        for old in old_copies(source, target):
+            stale.append(f"{dirname}/{old.name} (old copy)")
+        manifest[f"{dirname}/{source.name}"] = f"{dirname}/{target.name}"
+
+    for page in HTML_PAGES:
+        html_content = (ROOT / page).read_text(encoding="utf-8")
+        if rewrite_references(html_content, manifest) != html_content:
+            stale.append(f"{page} (outdated references)")
+    return stale
+
+
+def rewrite_references(html_content, manifest):
+    """Point asset references at their fingerprinted copies."""
+
+    def replace(match):
+        source = f"{match['dir']}/{match['stem']}{match['ext']}"
+        target = manifest.get(source)
+        if target is None:
+            return match.group(0)
+        return f'{match["attr"]}{match["prefix"]}{target}"'
+
+    return ASSET_REF_RE.sub(replace, html_content)
+
+
+def main(argv=None):
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Fingerprint js/css assets.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report stale fingerprints; exit 1 if there are any",
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = check_assets()
+        if stale:
+            print("❌ Fingerprinted assets are out of date:")
+            for path in stale:
+                print(f"   {path}")
+            print("Run: python scripts/fingerprint_assets.py")
+            return 1
+        print("✅ Fingerprinted assets are up to date")
+        return 0
+
+    print("🔍 Fingerprinting assets...")
+    manifest = fingerprint_assets()
+    for source, target in manifest.items():
+        print(f"   {source} → {target}")
+    print(f"✅ Fingerprinted {len(manifest)} assets")
+
+    print("\n📝 Rewriting asset references...")
+    for page in HTML_PAGES:
+        page_path = ROOT / page
+        with open(page_path, "r", encoding="utf-8") as f:
+            html_content = f.read()
+        updated = rewrite_references(html_content, manifest)
+        if updated != html_content:
+            with open(page_path, "w", encoding="utf-8") as f:
+                f.write(updated)
+            print(f"   ✏️  {page}")
+        else:
+            print(f"   ✓ {page} (up to date)")
+
+    print("\n✅ Assets fingerprinted!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
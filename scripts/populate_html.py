@@ -7,22 +7,45 @@ This script injects effects from effects.json into index.html:
 2. JSON-LD ItemList with all effects (for rich snippets)
 3. All interactive JavaScript still works (progressive enhancement)
 
+It also writes data/effects.min.json, the minified columnar payload that
+js/data.js loads in the browser (it records the sha256 of the effects.json
+it was built from).
+
+Both outputs are committed, so re-run this script whenever effects.json
+changes. With --check nothing is written; it exits 1 if either output is
+out of date (run_tests.sh runs it).
+
 Usage:
     python scripts/populate_html.py
+    python scripts/populate_html.py --check
 
 Output:
     Updates index.html with embedded effects data from effects.json
+    Writes data/effects.min.json
 """
 
+import argparse
 import json
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from export.columnar import (  # noqa: E402
+    client_payload_is_current,
+    client_payload_path,
+    write_client_payload,
+)
+
+ROOT = Path(__file__).parent.parent
+EFFECTS_PATH = ROOT / "data" / "effects.json"
+INDEX_PATH = ROOT / "index.html"
+
 
 def load_effects():
     """Load effects from effects.json"""
-    effects_path = Path(__file__).parent.parent / "data" / "effects.json"
-    with open(effects_path, "r", encoding="utf-8") as f:
+    with open(EFFECTS_PATH, "r", encoding="utf-8") as f:
         data = json.load(f)
     return data["effects"]
 
@@ -129,8 +152,43 @@ def inject_seo_data(html_content, table_html, jsonld):
     return html_content
 
 
-def main():
+def check():
+    """Report outputs that don't match effects.json. Returns the exit code."""
+    effects = load_effects()
+    with open(INDEX_PATH, "r", encoding="utf-8") as f:
+        html_content = f.read()
+    expected = inject_seo_data(
+        html_content, generate_table_rows(effects), generate_item_list_jsonld(effects)
+    )
+
+    stale = []
+    if expected != html_content:
+        stale.append(INDEX_PATH.name)
+    if not client_payload_is_current(str(EFFECTS_PATH)):
+        stale.append(f"data/{Path(client_payload_path(str(EFFECTS_PATH))).name}")
+
+    if stale:
+        print(f"❌ Out of date with effects.json: {', '.join(stale)}")
+        print("Run: python scripts/populate_html.py")
+        return 1
+    print("✅ index.html and the client payload match effects.json")
+    return 0
+
+
+def main(argv=None):
     """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description="Populate index.html and the client payload from effects.json."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report stale outputs; exit 1 if there are any",
+    )
+    args = parser.parse_args(argv)
+    if args.check:
+        return check()
+
     print("🔍 Loading effects from effects.json...")
     effects = load_effects()
     print(f"✅ Loaded {len(effects)} effects")
@@ -144,24 +202,31 @@ def main():
     print(f"✅ Generated ItemList with {len(effects)} items")
 
     print("\n📄 Reading index.html template...")
-    index_path = Path(__file__).parent.parent / "index.html"
-    with open(index_path, "r", encoding="utf-8") as f:
+    with open(INDEX_PATH, "r", encoding="utf-8") as f:
         html_content = f.read()
 
     print("💉 Injecting SEO data into HTML...")
     html_content = inject_seo_data(html_content, table_html, jsonld)
 
     print("💾 Writing updated index.html...")
-    with open(index_path, "w", encoding="utf-8") as f:
+    with open(INDEX_PATH, "w", encoding="utf-8") as f:
         f.write(html_content)
 
+    print("\n📦 Writing client payload...")
+    payload_size = write_client_payload(str(EFFECTS_PATH))
+    print(
+        f"✅ Wrote {Path(client_payload_path(str(EFFECTS_PATH))).name} "
+        f"({payload_size:,} bytes, effects.json {EFFECTS_PATH.stat().st_size:,} bytes)"
+    )
+
     print(f"\n✅ Successfully generated SEO-optimized index.html!")
     print(f"   - {len(effects)} effects in table")
     print(f"   - {len(effects)} items in JSON-LD")
     print(
         f"   - File size: {len(html_content):,} bytes ({len(html_content) / 1024:.1f} KB)"
     )
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Tests for mcmod/browser_pool.py with fake drivers (no Chrome needed).
+
+Covers recycling after max_pages, discarding a driver whose page raised,
+the reset between pages, the size bound, and that browser page loads in
+scrape_effect.py go through the per-host limiter. When Chrome is installed,
+a real pool also renders mcmod/fixtures/effect_page.html served from
+localhost and must pick up its delayed comment.
+
+Usage:
+    python scripts/test_browser_pool.py
+"""
+
+import shutil
+import sys
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+
+# The mcmod scripts import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcmod"))
+
+import scrape_effect  # noqa: E402
+from browser_pool import _RESET_SCRIPT, BrowserPool, fixture_server  # noqa: E402
+
+CHROME_AVAILABLE = any(
+    shutil.which(name)
+    for name in (
+        "google-chrome",
+        "google-chrome-stable",
+        "chromium",
+        "chromium-browser",
+    )
+)
+
+
+class FakeDriver:
+    """Records the WebDriver calls the pool makes."""
+
+    def __init__(self, number):
+        self.number = number
+        self.calls = []
+        self.quit_called = False
+        self.fail_reset = False
+
+    def delete_all_cookies(self):
+        self.calls.append(("delete_all_cookies",))
+        if self.fail_reset:
+            raise RuntimeError("browser is gone")
+
+    def execute_script(self, script):
+        self.calls.append(("execute_script", script))
+
+    def get(self, url):
+        self.calls.append(("get", url))
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.drivers = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            driver = FakeDriver(len(self.drivers))
+            self.drivers.append(driver)
+            return driver
+
+
+class BrowserPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.factory = FakeFactory()
+
+    def test_reuses_driver_and_resets_between_pages(self):
+        with BrowserPool(size=1, max_pages=10, driver_factory=self.factory) as pool:
+            for _ in range(3):
+                with pool.borrow() as driver:
+                    self.assertIs(driver, self.factory.drivers[0])
+        driver = self.factory.drivers[0]
+        reset = [
+            ("delete_all_cookies",),
+            ("execute_script", _RESET_SCRIPT),
+            ("get", "about:blank"),
+        ]
+        self.assertEqual(driver.calls, reset * 3)
+        self.assertEqual(pool.started, 1)
+        self.assertTrue(driver.quit_called, "close() quits idle drivers")
+
+    def test_recycles_after_max_pages(self):
+        pool = BrowserPool(size=1, max_pages=2, driver_factory=self.factory)
+        seen = []
+        for _ in range(5):
+            with pool.borrow() as driver:
+                seen.append(driver.number)
+        pool.close()
+
+        self.assertEqual(seen, [0, 0, 1, 1, 2])
+        self.assertEqual(pool.started, 3)
+        self.assertEqual(pool.recycled, 2)
+        self.assertTrue(all(d.quit_called for d in self.factory.drivers))
+
+    def test_discards_driver_when_page_raises(self):
+        pool = BrowserPool(size=1, max_pages=10, driver_factory=self.factory)
+        with self.assertRaises(ValueError):
+            with pool.borrow():
+                raise ValueError("page crashed")
+        first = self.factory.drivers[0]
+        self.assertTrue(first.quit_called)
+        self.assertEqual(first.calls, [], "a failed page is not reset")
+
+        with pool.borrow() as driver:
+            self.assertIsNot(driver, first)
+        self.assertEqual(pool.recycled, 1)
+        pool.close()
+
+    def test_discards_driver_when_reset_fails(self):
+        pool = BrowserPool(size=1, max_pages=10, driver_factory=self.factory)
+        with pool.borrow() as driver:
+            driver.fail_reset = True
+        self.assertTrue(self.factory.drivers[0].quit_called)
+        with pool.borrow() as driver:
+            self.assertEqual(driver.number, 1)
+        pool.close()
+
+    def test_never_exceeds_size(self):
+        pool = BrowserPool(size=2, max_pages=3, driver_factory=self.factory)
+        lock = threading.Lock()
+        in_use = 0
+        peak = 0
+
+        def load_page():
+            nonlocal in_use, peak
+            with pool.borrow() as _driver:
+                with lock:
+                    in_use += 1
+                    peak = max(peak, in_use)
+                time.sleep(0.01)
+                with lock:
+                    in_use -= 1
+
+        threads = [threading.Thread(target=load_page) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool.close()
+
+        self.assertLessEqual(peak, 2)
+        live = [d for d in self.factory.drivers if not d.quit_called]
+        self.assertEqual(live, [])
+        # 12 pages, recycled every 3 pages
+        self.assertEqual(pool.started, 4)
+
+    def test_borrow_times_out_when_all_busy(self):
+        pool = BrowserPool(size=1, driver_factory=self.factory)
+        with pool.borrow():
+            with self.assertRaises(TimeoutError):
+                with pool.borrow(timeout=0.05):
+                    pass
+        pool.close()
+
+    def test_borrow_after_close_fails(self):
+        pool = BrowserPool(size=1, driver_factory=self.factory)
+        pool.close()
+        with self.assertRaises(RuntimeError):
+            with pool.borrow():
+                pass
+
+
+class RecordingLimiter:
+    """HostLimiter stand-in that records when a slot is held."""
+
+    def __init__(self):
+        self.held = False
+        self.urls = []
+
+    @contextmanager
+    def slot(self, url):
+        self.urls.append(url)
+        self.held = True
+        try:
+            yield
+        finally:
+            self.held = False
+
+
+@unittest.skipUnless(scrape_effect.SELENIUM_AVAILABLE, "Selenium is not installed")
+class BrowserLoadLimitTest(unittest.TestCase):
+    def setUp(self):
+        self.original_load = scrape_effect.load_comment_page
+
+    def tearDown(self):
+        scrape_effect.load_comment_page = self.original_load
+
+    def test_page_load_holds_host_slot(self):
+        limiter = RecordingLimiter()
+        held_during_load = []
+
+        def fake_load(driver, url, timeout=10):
+            held_during_load.append(limiter.held)
+            return None
+
+        scrape_effect.load_comment_page = fake_load
+        url = "https://www.mcmod.cn/item/1.html"
+        with BrowserPool(size=1, driver_factory=FakeFactory()) as pool:
+            comments = scrape_effect.extract_comments_with_selenium(
+                url, browser_pool=pool, limiter=limiter
+            )
+
+        self.assertEqual(comments, [])
+        self.assertEqual(limiter.urls, [url])
+        self.assertEqual(held_during_load, [True])
+
+
+@unittest.skipUnless(
+    scrape_effect.SELENIUM_AVAILABLE and CHROME_AVAILABLE,
+    "Selenium or Chrome is not installed",
+)
+class BrowserFixtureTest(unittest.TestCase):
+    def test_extracts_delayed_comment_from_fixture(self):
+        with fixture_server() as base_url, BrowserPool(size=1) as pool:
+            comments = scrape_effect.extract_comments_with_selenium(
+                f"{base_url}/effect_page.html", browser_pool=pool
+            )
+
+        self.assertEqual(pool.started, 1)
+        self.assertEqual(len(comments), 1)
+        self.assertEqual(comments[0]["username"], "Fixture User")
+        self.assertEqual(comments[0]["text"], "Only level I exists.")
+
+
+if __name__ == "__main__":
+    unittest.main()
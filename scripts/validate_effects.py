@@ -13,17 +13,126 @@ Rules:
 9. Source: HTML tags (<i> only for mod names).
 10. Source: Special terms (spell patterns, no ampersands except in names).
 
-Exit code 0 if valid, else >0 with human-readable diagnostics to stderr.
+Each rule is an object; all of them run in a single traversal of the effects,
+sharing one pre-parsed EffectView per effect (bold spans, text outside bold,
+stripped text), with every pattern compiled once.
+
+By default validation stops at the first violation. With --all every
+violation is collected in the same pass and listed; --report writes them as
+JSON (implies --all):
+
+    python scripts/validate_effects.py --all
+    python scripts/validate_effects.py --report logs/validation.json
+    python scripts/validate_effects.py --report -        # JSON to stdout
+
+Results are cached in data/.validation-cache.json, keyed by each effect's
+content hash and RULESET_VERSION (a hash of this script, so editing any rule
+invalidates the cache): per-effect rules only re-run for new or changed
+effects, and the global rules (duplicates, ordering) only when the sequence
+of (mod, effect) names changes. A byte-identical effects.json that
+passed before is not re-checked at all. Only clean results are cached, so
+every violation is reported on every run. --no-cache ignores the cache.
+
+Exit code 0 if valid, 1 if any rule was violated, 2 if the dataset could not
+be loaded; human-readable diagnostics go to stderr.
 """
+
 from __future__ import annotations
+import argparse
+import hashlib
 import json
 import sys
 import re
+from functools import cached_property
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 PREFIX = "[Effects Validation]"
 
+EXIT_OK = 0
+EXIT_VIOLATIONS = 1
+EXIT_LOAD_ERROR = 2
+
 EFFECTS_PATH = Path(__file__).resolve().parent.parent / "data" / "effects.json"
+CACHE_PATH = EFFECTS_PATH.parent / ".validation-cache.json"
+
+# Hash of this file: rules share module-level constants and helpers, so any
+# edit to the validator discards cached results
+RULESET_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+BOLD_SPAN_RE = re.compile(r"<b>(.*?)</b>")
+ITALIC_SPAN_RE = re.compile(r"<i>(.*?)</i>")
+NON_BOLD_TAG_RE = re.compile(r"<(?!b>|/b>)[^>]+>")
+NON_ITALIC_TAG_RE = re.compile(r"<(?!i>|/i>)[^>]+>")
+COMMA_WITHOUT_SPACE_RE = re.compile(r",[^ ]")
+ITALIC_AMPERSAND_RE = re.compile(r"<i>[^<]*&[^<]*</i>")
+SPELL_SOURCE_RE = re.compile(
+    r"(spells?)\s+from\s+<i>Iron Spells'n'Spellbooks\s*</i>\s+mod"
+)
+
+# Effect 'level' references forbidden for maxLevel I ("hunger level" and
+# "water level" are exempt)
+LEVEL_REFERENCE_RES = [
+    re.compile(r"\blevel\b(?!\s+(of|in|at|on|from|to|with))"),
+    re.compile(r"by\s+<b>level</b>"),
+    re.compile(r"<b>level</b>"),
+]
+
+REQUIRED_FIELDS = [
+    "mod",
+    "id",
+    "effect",
+    "maxLevel",
+    "type",
+    "tags",
+    "description",
+    "source",
+]
+TEXT_FIELDS = ["mod", "effect", "description", "source"]
+VALID_ROMAN_NUMERALS = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X"]
+
+TIME_TERMS = ["second", "seconds", "second(s)"]
+FORMULA_TERMS = ["^level", "× level"]
+POWER_LEVEL_ENDINGS = (
+    "^level",
+    "^level second",
+    "^level seconds",
+    "^level second(s)",
+)
+TIMES_LEVEL_ENDINGS = (
+    "× level",
+    "× level)",
+    "× level second",
+    "× level seconds",
+    "× level second(s)",
+)
+
+# Common non-mod terms that shouldn't be italicized
+FORBIDDEN_ITALIC_TERMS = {
+    "Tarantula Hawk",
+    "Rocky Roller",
+    "Enderiophage",
+    "Frilled Shark",
+    "Jerboa",
+    "Nucleeper",
+    "Brainiac",
+    "Tremorzilla",
+    "Gammaroach",
+    "Warden",
+    "Elder Guardian",
+    "Wither",
+    "Wither Skeleton",
+    "Cave Spider",
+    "Stray",
+    "Husk",
+    "Illusioner",
+    "Shulker",
+    # Add other common mob/item names that are often mistakenly italicized
+}
+ITALIC_EXCEPTIONS = {"To be added.", "Unavailable."}
+NON_MOD_ITALIC_WORDS = ["attacks", "landing", "projectile", "arrow"]
 
 
 def load_effects():
@@ -31,12 +140,12 @@ def load_effects():
         with EFFECTS_PATH.open("r", encoding="utf-8") as f:
             data = json.load(f)
     except FileNotFoundError:
-        fail(f"File not found: {EFFECTS_PATH}")
+        fail(f"File not found: {EFFECTS_PATH}", EXIT_LOAD_ERROR)
     except json.JSONDecodeError as e:
-        fail(f"Invalid JSON in {EFFECTS_PATH}: {e}")
+        fail(f"Invalid JSON in {EFFECTS_PATH}: {e}", EXIT_LOAD_ERROR)
 
     if "effects" not in data or not isinstance(data["effects"], list):
-        fail("Missing 'effects' list in JSON root")
+        fail("Missing 'effects' list in JSON root", EXIT_LOAD_ERROR)
     return data["effects"]
 
 
@@ -47,496 +156,750 @@ def fail(msg: str, code: int = 1):
 
 def strip_html_tags(text: str) -> str:
     """Remove HTML tags from text for length calculation."""
-    return re.sub(r"<[^>]+>", "", text)
+    return HTML_TAG_RE.sub("", text)
 
 
-def validate_description_html_tags(effects):
-    """Ensure formulas and time units are properly wrapped in <b> tags.
+class Violation:
+    """One rule violation, optionally tied to an effect and field."""
 
-    Rules:
-    - '^level' and '× level' must be inside <b> tags and either be at the end
-      or followed by "second", "seconds", or "second(s)"
-    - Every instance of "second", "seconds", or "second(s)" must be wrapped in <b> tags
-    - Every instance of '+' must be wrapped in <b> tags (all plus symbols)
-    - Effects with maxLevel 'I' cannot contain 'higher level' in description
-    - Effects with maxLevel 'I' cannot contain 'level' in description (always level 1)
-    - ONLY <b> tags allowed in descriptions (exception: "<i>To be added.</i>" and "<i>Unavailable.</i>")
-    - Note: Duplicate effect names across mods are allowed if descriptions differ
+    def __init__(
+        self,
+        rule: str,
+        message: str,
+        effect_id: Optional[str] = None,
+        field: Optional[str] = None,
+    ):
+        self.rule = rule
+        self.message = message
+        self.effect_id = effect_id
+        self.field = field
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "effect_id": self.effect_id,
+            "rule": self.rule,
+            "message": self.message,
+            "field": self.field,
+        }
+
+
+class EffectView:
+    """An effect plus derived text shared by all rules, each computed once."""
+
+    def __init__(self, index: int, effect: dict):
+        self.index = index
+        self.effect = effect
+        self.id = effect.get("id")
+        self.name = effect.get("effect") or "Unknown"
+        self.max_level = effect.get("maxLevel")
+        self.description = effect.get("description") or ""
+        self.source = effect.get("source") or ""
+        self._stripped = {}
+
+    @cached_property
+    def bold_spans(self) -> List[str]:
+        """Contents of every <b>...</b> span in the description."""
+        return BOLD_SPAN_RE.findall(self.description)
+
+    @cached_property
+    def outside_bold(self) -> str:
+        """Description with every bold span removed."""
+        return BOLD_SPAN_RE.sub("", self.description)
+
+    @cached_property
+    def source_italics(self) -> List[str]:
+        """Contents of every <i>...</i> span in the source."""
+        return ITALIC_SPAN_RE.findall(self.source)
+
+    def text(self, field: str):
+        """Field value as the text rules see it (missing/empty -> "")."""
+        return self.effect.get(field) or ""
+
+    def stripped(self, field: str) -> str:
+        """Field text with HTML tags removed."""
+        if field not in self._stripped:
+            self._stripped[field] = strip_html_tags(self.text(field))
+        return self._stripped[field]
+
+
+class Rule:
+    """A validation rule; check() sees every effect once, in dataset order.
+
+    Per-effect rules look at one effect at a time and may be skipped for
+    effects the cache already knows are clean. Global rules (per_effect =
+    False) depend only on the ordered (mod, effect) names.
     """
-    # Terms that must be in bold
-    time_terms = ["second", "seconds", "second(s)"]
-    formula_terms = ["^level", "× level"]
-
-    for eff in effects:
-        desc = eff.get("description") or ""
-        name = eff.get("effect") or "Unknown"
-        max_level = eff.get("maxLevel") or ""
-
-        # Check for non-<b> HTML tags in description, excluding allowed special cases
-        desc_without_exceptions = desc
-        if re.search(r"<(?!b>|/b>)[^>]+>", desc_without_exceptions):
-            fail(
-                f"Effect '{name}': Description should ONLY contain <b> tags (found other HTML tags). Exception: '<i>To be added.</i>' and '<i>Unavailable.</i>' are allowed."
-            )
-
-        # Extract bold content and content outside bold
-        bold_spans = re.findall(r"<b>(.*?)</b>", desc)
-        outside = re.sub(r"<b>.*?</b>", "", desc)
-
-        # Check for formula terms outside bold
-        for term in formula_terms:
-            if term in outside:
-                fail(f"Formula '{term}' must be in <b> tags in effect '{name}'")
-
-        # Check for time terms outside bold
-        for term in time_terms:
-            if term in outside:
-                fail(f"Time unit '{term}' must be in <b> tags in effect '{name}'")
-
-        # Check for '+' outside bold (ALL '+' symbols must be in bold)
-        if "+" in outside:
-            fail(f"Plus symbol '+' must be in <b> tags in effect '{name}'")
-
-        # Check for 'higher level' in non-scaling effects
-        if max_level == "I" and "higher level" in desc:
-            fail(
-                f"Effect '{name}' with maxLevel 'I' cannot contain 'higher level' in description (non-scaling effect)"
-            )
-
-        # Check for effect 'level' references in non-scaling effects
-        # Look for patterns that suggest effect level: "× level", "^level", "level", but exclude "hunger level", "water level", etc.
-        if max_level == "I":
-            # Check for mathematical level references
-            level_patterns = [
-                r"\blevel\b(?!\s+(of|in|at|on|from|to|with))",  # "level" not followed by prepositions
-                r"by\s+<b>level</b>",  # "by level"
-                r"<b>level</b>",  # "level" in bold tags
-            ]
-            for pattern in level_patterns:
-                if (
-                    re.search(pattern, desc)
-                    and "hunger level" not in desc
-                    and "water level" not in desc
-                ):
-                    fail(
-                        f"Effect '{name}' with maxLevel 'I' cannot contain effect 'level' references in description (always level 1)"
-                    )
-
-        # Check formula placement within bold spans
-        for span in bold_spans:
-            # For ^level
-            if "^level" in span:
-                valid_endings = [
-                    "^level",
-                    "^level second",
-                    "^level seconds",
-                    "^level second(s)",
-                ]
-                if not any(span.endswith(end) for end in valid_endings):
-                    fail(
-                        f"'^level' incorrectly positioned in bold span in effect '{name}' -> <b>{span}</b>"
-                    )
-
-            # For × level (when not in a span with ^level)
-            if "× level" in span and "^level" not in span:
-                valid_endings = [
-                    "× level",
-                    "× level)",
-                    "× level second",
-                    "× level seconds",
-                    "× level second(s)",
-                ]
-                if not any(span.endswith(end) for end in valid_endings):
-                    fail(
-                        f"'× level' incorrectly positioned in bold span in effect '{name}' -> <b>{span}</b>"
-                    )
-
 
-def validate_source_potion_grouping(effects):
-    """Validate Potion/Arrow/Charm grouping rules.
+    number = 0
+    name = ""
+    title = ""
+    per_effect = True
 
-    Rules:
-    - FORBIDDEN: "Potion/Arrow/Splash/Lingering" or "Potion/Splash/Lingering" (should be simplified)
-    - Check for common mistakes in potion variant naming
-    """
-    for eff in effects:
-        source = eff.get("source") or ""
-        name = eff.get("effect") or "Unknown"
-
-        # Check for forbidden Splash/Lingering in grouping patterns
-        if "Potion/Arrow/Splash/Lingering" in source:
-            fail(
-                f"Effect '{name}': Use 'Potion/Arrow/Charm' or 'Potion/Arrow' instead of 'Potion/Arrow/Splash/Lingering'"
-            )
+    def violation(
+        self, message: str, view: Optional[EffectView] = None, field: str = None
+    ) -> Violation:
+        return Violation(self.name, message, view.id if view else None, field)
 
-        if "Potion/Splash/Lingering" in source:
-            fail(
-                f"Effect '{name}': Use 'Potion' or 'Potion/Arrow/Charm' instead of 'Potion/Splash/Lingering'"
-            )
+    def check(self, view: EffectView) -> Iterator[Violation]:
+        return iter(())
 
-        # Check for other verbose potion naming
-        if "/Splash/" in source or "/Lingering/" in source:
-            fail(
-                f"Effect '{name}': Don't name every potion variant - use default (Potion) instead of Splash/Lingering variants"
-            )
+    def finish(self) -> Iterator[Violation]:
+        """Report violations only known after the last effect (global rules)."""
+        return iter(())
 
 
-def validate_source_html_tags(effects):
-    """Validate HTML tag usage in source field.
+class NoEmptyFieldsRule(Rule):
+    """All fields must be present and non-empty."""
 
-    Rules:
-    - <i> tags should ONLY be used for mod names
-    - No <i> tags for mob names, item names, etc.
-    - Check for common mistakes like italicizing mob/item names
-    - ONLY <i> tags allowed in sources (no <b>, <u>, etc.)
-    """
-    for eff in effects:
-        source = eff.get("source") or ""
-        name = eff.get("effect") or "Unknown"
-
-        # Check for non-<i> HTML tags in source
-        if re.search(r"<(?!i>|/i>)[^>]+>", source):
-            fail(
-                f"Effect '{name}': Source should ONLY contain <i> tags (found other HTML tags like <b>, <u>, etc.)"
-            )
+    number, name, title = 1, "no-empty-fields", "No empty fields"
 
-        # Find all italic content
-        italic_matches = re.findall(r"<i>(.*?)</i>", source)
-
-        # Common non-mod terms that shouldn't be italicized
-        forbidden_italic_terms = [
-            "Tarantula Hawk",
-            "Rocky Roller",
-            "Enderiophage",
-            "Frilled Shark",
-            "Jerboa",
-            "Nucleeper",
-            "Brainiac",
-            "Tremorzilla",
-            "Gammaroach",
-            "Warden",
-            "Elder Guardian",
-            "Wither",
-            "Wither Skeleton",
-            "Cave Spider",
-            "Stray",
-            "Husk",
-            "Illusioner",
-            "Shulker",
-            # Add other common mob/item names that are often mistakenly italicized
-        ]
-
-        for italic_content in italic_matches:
-            # Skip special cases
-            if italic_content in ["To be added.", "Unavailable."]:
+    def check(self, view):
+        for field in REQUIRED_FIELDS:
+            if field not in view.effect:
+                yield self.violation(
+                    f"Effect '{view.name}': Missing required field '{field}'",
+                    view,
+                    field,
+                )
                 continue
 
-            # Check if it's a forbidden term
-            if italic_content in forbidden_italic_terms:
-                fail(
-                    f"Effect '{name}': Mob/item name '<i>{italic_content}</i>' should not be italicized (only mod names use <i> tags)"
-                )
+            value = view.effect[field]
 
-            # Check for patterns that suggest it's not a mod name
-            # Mod names typically contain "mod" or are proper capitalization without common words
-            if any(
-                word in italic_content.lower()
-                for word in ["attacks", "landing", "projectile", "arrow"]
-            ):
-                fail(
-                    f"Effect '{name}': '<i>{italic_content}</i>' appears to be a description, not a mod name (only mod names should use <i> tags)"
+            # Check for empty strings
+            if isinstance(value, str) and not value.strip():
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' is empty", view, field
                 )
 
-
-def validate_source_special_terms(effects):
-    """Validate special source terms and grouping rules.
-
-    Rules:
-    - Use "Delights" for multiple items from mods containing "delight"
-    - Use "Unique Weapons" for Simple Swords weapons
-    - Use "Affix Items" for Apotheosis affixes
-    - Use spell patterns for Iron Spells'n'Spellbooks
-    - Use "tools/weapons/armor sets from <i>ModName</i>" pattern
-    """
-    for eff in effects:
-        source = eff.get("source") or ""
-        name = eff.get("effect") or "Unknown"
-
-        # Check for improper ampersand usage (should use "and" instead)
-        if " & " in source or "&amp;" in source:
-            # Allow if it's part of a mod name
-            if not re.search(r"<i>[^<]*&[^<]*</i>", source):
-                fail(
-                    f"Effect '{name}': Use 'and' instead of '&' in source (unless it's part of a mod/item name)"
+            # Check for empty lists
+            if isinstance(value, list) and len(value) == 0:
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' is an empty list",
+                    view,
+                    field,
                 )
 
-        # Check for spell formatting from Iron Spells'n'Spellbooks
-        if "spell" in source.lower() and "Iron Spells" in source:
-            # Should be: "X spell from <i>Iron Spells'n'Spellbooks</i> mod" or "spells from <i>Iron Spells'n'Spellbooks</i> mod"
-            # Allow for optional whitespace before </i>
-            if not re.search(
-                r"(spells?)\s+from\s+<i>Iron Spells'n'Spellbooks\s*</i>\s+mod", source
-            ):
-                fail(
-                    f"Effect '{name}': Spell references should follow pattern 'X spell from <i>Iron Spells'n'Spellbooks</i> mod' or 'spells from <i>Iron Spells'n'Spellbooks</i> mod'"
+            # Check for None
+            if value is None:
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' is null", view, field
                 )
 
 
-def validate_text_formatting(effects):
-    """Validate general text formatting across all text fields.
-
-    Rules:
-    - No double spaces
-    - No leading/trailing whitespace
-    - Space after comma (not before)
-    """
-    fields_to_check = ["mod", "effect", "description", "source"]
+class TextFormattingRule(Rule):
+    """No double spaces, no leading/trailing whitespace, space after (not before) commas."""
 
-    for eff in effects:
-        name = eff.get("effect") or "Unknown"
+    number, name, title = 2, "text-formatting", "General text formatting"
 
-        for field in fields_to_check:
-            value = eff.get(field) or ""
+    def check(self, view):
+        for field in TEXT_FIELDS:
+            value = view.text(field)
 
             # Check for double spaces
             if "  " in value:
-                fail(
-                    f"Effect '{name}': Field '{field}' contains double spaces (use single spaces)"
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' contains double spaces (use single spaces)",
+                    view,
+                    field,
                 )
 
             # Check for leading/trailing whitespace
             if value != value.strip():
-                fail(
-                    f"Effect '{name}': Field '{field}' has leading or trailing whitespace"
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' has leading or trailing whitespace",
+                    view,
+                    field,
                 )
 
-            # Check for comma without space after (except in HTML tags)
-            # Remove HTML tags first to avoid false positives
-            value_without_html = re.sub(r"<[^>]+>", "", value)
-            if re.search(r",[^ ]", value_without_html):
-                fail(
-                    f"Effect '{name}': Field '{field}' - comma should be followed by a space"
+            # Check for comma without space after (HTML tags removed first
+            # to avoid false positives)
+            if COMMA_WITHOUT_SPACE_RE.search(view.stripped(field)):
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' - comma should be followed by a space",
+                    view,
+                    field,
                 )
 
             # Check for space before comma
             if " ," in value:
-                fail(f"Effect '{name}': Field '{field}' - remove space before comma")
+                yield self.violation(
+                    f"Effect '{view.name}': Field '{field}' - remove space before comma",
+                    view,
+                    field,
+                )
 
 
-def validate_no_empty_fields(effects):
-    """Ensure all required fields are non-empty.
+class DuplicateNamesRule(Rule):
+    """No duplicate effect names within a mod."""
 
-    Rules:
-    - All fields must be present and non-empty
-    """
-    required_fields = [
-        "mod",
-        "id",
-        "effect",
-        "maxLevel",
-        "type",
-        "tags",
-        "description",
-        "source",
-    ]
+    number, name, title = 3, "duplicate-names", "Duplicate effect name"
+    per_effect = False
 
-    for eff in effects:
-        name = eff.get("effect") or "Unknown"
+    def __init__(self):
+        self.names_by_mod = {}
 
-        for field in required_fields:
-            if field not in eff:
-                fail(f"Effect '{name}': Missing required field '{field}'")
+    def check(self, view):
+        mod = view.effect.get("mod")
+        name = view.effect.get("effect")
+        names = self.names_by_mod.setdefault(mod, set())
+        if name in names:
+            yield self.violation(
+                f"Duplicate effect name detected within mod '{mod}': '{name}'",
+                view,
+                "effect",
+            )
+        names.add(name)
 
-            value = eff.get(field)
 
-            # Check for empty strings
-            if isinstance(value, str) and not value.strip():
-                fail(f"Effect '{name}': Field '{field}' is empty")
+class OrderingRule(Rule):
+    """Minecraft first (alphabetical by effect), then mods alphabetically, each sorted by effect.
 
-            # Check for empty lists
-            if isinstance(value, list) and len(value) == 0:
-                fail(f"Effect '{name}': Field '{field}' is an empty list")
+    Checked incrementally: each effect is compared only with the previous
+    Minecraft effect, the previous newly seen mod, or the previous effect of
+    its own mod, so no section is ever re-sorted.
+    """
 
-            # Check for None
-            if value is None:
-                fail(f"Effect '{name}': Field '{field}' is null")
+    number, name, title = 4, "ordering", "Effect ordering"
+    per_effect = False
 
+    def __init__(self):
+        self.count = 0
+        self.minecraft_seen = False
+        self.mod_seen = False
+        self.misplaced_reported = False
+        self.last_minecraft_name = None
+        self.last_new_mod = None
+        self.last_name_by_mod = {}
 
-def validate_max_level_format(effects):
-    """Validate maxLevel field format.
+    def check(self, view):
+        self.count += 1
+        mod = view.effect.get("mod")
+        name = view.effect.get("effect") or ""
 
-    Rules:
-    - Must be a Roman numeral from I to X
-    """
-    valid_roman_numerals = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X"]
+        if mod == "Minecraft":
+            self.minecraft_seen = True
+            if self.mod_seen:
+                if not self.misplaced_reported:
+                    self.misplaced_reported = True
+                    yield self.violation(
+                        "Minecraft section not first or not contiguous", view, "mod"
+                    )
+                return
+            previous = self.last_minecraft_name
+            if previous is not None and previous.lower() > name.lower():
+                yield self.violation(
+                    f"Minecraft ordering error: '{previous}' should come after '{name}' (alphabetical)",
+                    view,
+                    "effect",
+                )
+            self.last_minecraft_name = name
+            return
+
+        self.mod_seen = True
+        mod = mod or ""
+        previous = self.last_name_by_mod.get(mod)
+        if previous is None:
+            # First effect of a mod: mods must appear alphabetically
+            if (
+                self.last_new_mod is not None
+                and self.last_new_mod.lower() > mod.lower()
+            ):
+                yield self.violation(
+                    f"Mod ordering error: '{self.last_new_mod}' should come after '{mod}' (alphabetical)",
+                    view,
+                    "mod",
+                )
+            self.last_new_mod = mod
+        elif previous.lower() > name.lower():
+            yield self.violation(
+                f"Effect ordering error in mod '{mod}': '{previous}' should come after '{name}' (alphabetical)",
+                view,
+                "effect",
+            )
+        self.last_name_by_mod[mod] = name
+
+    def finish(self):
+        if self.count == 0:
+            yield self.violation("No effects present (empty list)")
+        elif not self.minecraft_seen:
+            yield self.violation(
+                "Minecraft section missing (no entries with mod 'Minecraft')"
+            )
+
+
+class MaxLevelRule(Rule):
+    """maxLevel must be a Roman numeral from I to X."""
 
-    for eff in effects:
-        name = eff.get("effect") or "Unknown"
-        max_level = eff.get("maxLevel")
+    number, name, title = 5, "max-level", "Max level format"
 
-        if max_level not in valid_roman_numerals:
-            fail(
-                f"Effect '{name}': maxLevel must be a Roman numeral from I to X, got '{max_level}'"
+    def check(self, view):
+        if view.max_level not in VALID_ROMAN_NUMERALS:
+            yield self.violation(
+                f"Effect '{view.name}': maxLevel must be a Roman numeral from I to X, got '{view.max_level}'",
+                view,
+                "maxLevel",
             )
 
 
-def main():
-    print(f"{PREFIX}: 🚀 Starting validation...")
-    effects = load_effects()
+class DescriptionHtmlRule(Rule):
+    """Formulas, time units and '+' must be bold; maxLevel I must not mention levels.
 
-    # General checks (most important first)
-
-    # 1. No empty fields check
-    print(f"{PREFIX}: 1/10 No empty fields check started...")
-    validate_no_empty_fields(effects)
-    print(f"{PREFIX}: ✅ No empty fields check passed.")
-
-    # 2. Text formatting check (applies to multiple fields)
-    print(f"{PREFIX}: 2/10 General text formatting check started...")
-    validate_text_formatting(effects)
-    print(f"{PREFIX}: ✅ General text formatting check passed.")
-
-    # 3. Duplicate name check (within each mod)
-    print(f"{PREFIX}: 3/10 Duplicate effect name check started...")
-    mod_to_effect_names = {}
-    for e in effects:
-        mod = e.get("mod")
-        name = e.get("effect")
-        if mod not in mod_to_effect_names:
-            mod_to_effect_names[mod] = set()
-        if name in mod_to_effect_names[mod]:
-            fail(f"Duplicate effect name detected within mod '{mod}': '{name}'")
-        mod_to_effect_names[mod].add(name)
-    print(f"{PREFIX}: ✅ Duplicate effect name check passed.")
-
-    # 4. Ordering check
-    print(f"{PREFIX}: 4/10 Effect ordering check started...")
-
-    if not effects:
-        fail("No effects present (empty list)")
-
-    # Collect indices of the Minecraft section
-    minecraft_indices = [
-        i for i, e in enumerate(effects) if e.get("mod") == "Minecraft"
-    ]
-    if not minecraft_indices:
-        fail("Minecraft section missing (no entries with mod 'Minecraft')")
+    - '^level' and '× level' must be inside <b> tags and either be at the end
+      or followed by "second", "seconds", or "second(s)"
+    - ONLY <b> tags allowed in descriptions (exception: "<i>To be added.</i>"
+      and "<i>Unavailable.</i>")
+    """
 
-    # Must be contiguous starting at 0
-    if minecraft_indices[0] != 0 or minecraft_indices != list(
-        range(minecraft_indices[0], minecraft_indices[-1] + 1)
-    ):
-        fail("Minecraft section not first or not contiguous")
-
-    # Check minecraft alphabetical order by effect
-    mc_slice = effects[minecraft_indices[0] : minecraft_indices[-1] + 1]
-    mc_effect_names = [e.get("effect") for e in mc_slice]
-    if mc_effect_names != sorted(mc_effect_names, key=lambda s: s.lower()):
-        # Find first out-of-order pair
-        for a, b in zip(mc_effect_names, mc_effect_names[1:]):
-            if a.lower() > b.lower():
-                fail(
-                    f"Minecraft ordering error: '{a}' should come after '{b}' (alphabetical)"
-                )
+    number, name, title = 6, "description-html", "Description HTML tag usage"
 
-    # Remaining effects
-    tail = effects[minecraft_indices[-1] + 1 :]
+    def check(self, view):
+        name = view.name
+        desc = view.description
 
-    # Build mod -> list mapping preserving order
-    mods_in_order = []
-    mod_to_effects = {}
-    for eff in tail:
-        mod = eff.get("mod")
-        if mod == "Minecraft":
-            fail("Found a Minecraft effect after mod sections (section must be first)")
-        if mod not in mod_to_effects:
-            mods_in_order.append(mod)
-            mod_to_effects[mod] = []
-        mod_to_effects[mod].append(eff)
-
-    # Check mods alphabetical
-    if mods_in_order != sorted(mods_in_order, key=lambda s: s.lower()):
-        for a, b in zip(mods_in_order, mods_in_order[1:]):
-            if a.lower() > b.lower():
-                fail(
-                    f"Mod ordering error: '{a}' should come after '{b}' (alphabetical)"
+        if NON_BOLD_TAG_RE.search(desc):
+            yield self.violation(
+                f"Effect '{name}': Description should ONLY contain <b> tags (found other HTML tags). Exception: '<i>To be added.</i>' and '<i>Unavailable.</i>' are allowed.",
+                view,
+                "description",
+            )
+
+        outside = view.outside_bold
+        for term in FORMULA_TERMS:
+            if term in outside:
+                yield self.violation(
+                    f"Formula '{term}' must be in <b> tags in effect '{name}'",
+                    view,
+                    "description",
+                )
+        for term in TIME_TERMS:
+            if term in outside:
+                yield self.violation(
+                    f"Time unit '{term}' must be in <b> tags in effect '{name}'",
+                    view,
+                    "description",
+                )
+        if "+" in outside:
+            yield self.violation(
+                f"Plus symbol '+' must be in <b> tags in effect '{name}'",
+                view,
+                "description",
+            )
+
+        if view.max_level == "I":
+            if "higher level" in desc:
+                yield self.violation(
+                    f"Effect '{name}' with maxLevel 'I' cannot contain 'higher level' in description (non-scaling effect)",
+                    view,
+                    "description",
+                )
+            if (
+                "hunger level" not in desc
+                and "water level" not in desc
+                and any(pattern.search(desc) for pattern in LEVEL_REFERENCE_RES)
+            ):
+                yield self.violation(
+                    f"Effect '{name}' with maxLevel 'I' cannot contain effect 'level' references in description (always level 1)",
+                    view,
+                    "description",
                 )
 
-    # Check each mod internal order
-    for mod, eff_list in mod_to_effects.items():
-        names = [e.get("effect") for e in eff_list]
-        if names != sorted(names, key=lambda s: s.lower()):
-            for a, b in zip(names, names[1:]):
-                if a.lower() > b.lower():
-                    fail(
-                        f"Effect ordering error in mod '{mod}': '{a}' should come after '{b}' (alphabetical)"
+        # Check formula placement within bold spans
+        for span in view.bold_spans:
+            if "^level" in span:
+                if not span.endswith(POWER_LEVEL_ENDINGS):
+                    yield self.violation(
+                        f"'^level' incorrectly positioned in bold span in effect '{name}' -> <b>{span}</b>",
+                        view,
+                        "description",
                     )
-    print(f"{PREFIX}: ✅ Effect ordering check passed.")
+            elif "× level" in span and not span.endswith(TIMES_LEVEL_ENDINGS):
+                yield self.violation(
+                    f"'× level' incorrectly positioned in bold span in effect '{name}' -> <b>{span}</b>",
+                    view,
+                    "description",
+                )
 
-    # Column-specific checks (in column order: mod, effect, maxLevel, description, tags, source)
 
-    # 5. Max level format check
-    print(f"{PREFIX}: 5/10 Max level format check started...")
-    validate_max_level_format(effects)
-    print(f"{PREFIX}: ✅ Max level format check passed.")
+class TagsRule(Rule):
+    """Exactly one of positive/negative; 'scaling' iff maxLevel > I."""
 
-    # 6. Description HTML tag usage check
-    print(f"{PREFIX}: 6/10 Description HTML tag usage check started...")
-    validate_description_html_tags(effects)
-    print(f"{PREFIX}: ✅ Description HTML tag usage check passed.")
+    number, name, title = 7, "tags", "Tags validation"
 
-    # 7. Tags validation check
-    print(f"{PREFIX}: 7/10 Tags validation check started...")
-    for eff in effects:
-        tags = eff.get("tags", [])
+    def check(self, view):
+        tags = view.effect.get("tags", [])
+        name = view.effect.get("effect")
         if not isinstance(tags, list):
-            fail(f"Tags must be a list for effect '{eff.get('effect')}'")
+            yield self.violation(
+                f"Tags must be a list for effect '{name}'", view, "tags"
+            )
+            return
 
         if "positive" not in tags and "negative" not in tags:
-            fail(
-                f"Effect '{eff.get('effect')}' must have either 'positive' or 'negative' tag"
+            yield self.violation(
+                f"Effect '{name}' must have either 'positive' or 'negative' tag",
+                view,
+                "tags",
             )
 
         if "positive" in tags and "negative" in tags:
-            fail(
-                f"Effect '{eff.get('effect')}' cannot have both 'positive' and 'negative' tags"
+            yield self.violation(
+                f"Effect '{name}' cannot have both 'positive' and 'negative' tags",
+                view,
+                "tags",
             )
 
-        # Check scaling tag requirements
-        max_level = eff.get("maxLevel")
-        if max_level == "I":
-            # Effects with maxLevel "I" cannot have scaling tag
+        if view.max_level == "I":
             if "scaling" in tags:
-                fail(
-                    f"Effect '{eff.get('effect')}' with maxLevel 'I' cannot have 'scaling' tag (non-scaling effect)"
+                yield self.violation(
+                    f"Effect '{name}' with maxLevel 'I' cannot have 'scaling' tag (non-scaling effect)",
+                    view,
+                    "tags",
                 )
+        elif "scaling" not in tags:
+            yield self.violation(
+                f"Effect '{name}' with maxLevel '{view.max_level}' must have 'scaling' tag",
+                view,
+                "tags",
+            )
+
+
+class PotionGroupingRule(Rule):
+    """No Splash/Lingering variants in Potion/Arrow/Charm groupings."""
+
+    number, name, title = 8, "potion-grouping", "Source potion grouping"
+
+    def check(self, view):
+        source = view.source
+        if "Potion/Arrow/Splash/Lingering" in source:
+            message = "Use 'Potion/Arrow/Charm' or 'Potion/Arrow' instead of 'Potion/Arrow/Splash/Lingering'"
+        elif "Potion/Splash/Lingering" in source:
+            message = "Use 'Potion' or 'Potion/Arrow/Charm' instead of 'Potion/Splash/Lingering'"
+        elif "/Splash/" in source or "/Lingering/" in source:
+            message = "Don't name every potion variant - use default (Potion) instead of Splash/Lingering variants"
         else:
-            # Effects with maxLevel > "I" must have scaling tag
-            if "scaling" not in tags:
-                fail(
-                    f"Effect '{eff.get('effect')}' with maxLevel '{max_level}' must have 'scaling' tag"
+            return
+        yield self.violation(f"Effect '{view.name}': {message}", view, "source")
+
+
+class SourceHtmlRule(Rule):
+    """Only <i> tags in sources, and only around mod names."""
+
+    number, name, title = 9, "source-html", "Source HTML tag usage"
+
+    def check(self, view):
+        name = view.name
+        if NON_ITALIC_TAG_RE.search(view.source):
+            yield self.violation(
+                f"Effect '{name}': Source should ONLY contain <i> tags (found other HTML tags like <b>, <u>, etc.)",
+                view,
+                "source",
+            )
+
+        for italic_content in view.source_italics:
+            if italic_content in ITALIC_EXCEPTIONS:
+                continue
+
+            if italic_content in FORBIDDEN_ITALIC_TERMS:
+                yield self.violation(
+                    f"Effect '{name}': Mob/item name '<i>{italic_content}</i>' should not be italicized (only mod names use <i> tags)",
+                    view,
+                    "source",
+                )
+
+            # Mod names don't read like descriptions of how an effect is applied
+            lowered = italic_content.lower()
+            if any(word in lowered for word in NON_MOD_ITALIC_WORDS):
+                yield self.violation(
+                    f"Effect '{name}': '<i>{italic_content}</i>' appears to be a description, not a mod name (only mod names should use <i> tags)",
+                    view,
+                    "source",
                 )
-    print(f"{PREFIX}: ✅ Tags validation check passed.")
 
-    # Source validation checks
 
-    # 8. Source potion grouping check
-    print(f"{PREFIX}: 8/10 Source potion grouping check started...")
-    validate_source_potion_grouping(effects)
-    print(f"{PREFIX}: ✅ Source potion grouping check passed.")
+class SourceTermsRule(Rule):
+    """'and' instead of '&' (outside names); Iron Spells'n'Spellbooks spell pattern."""
+
+    number, name, title = 10, "source-terms", "Source special terms"
+
+    def check(self, view):
+        source = view.source
+        name = view.name
+
+        if (" & " in source or "&amp;" in source) and not ITALIC_AMPERSAND_RE.search(
+            source
+        ):
+            yield self.violation(
+                f"Effect '{name}': Use 'and' instead of '&' in source (unless it's part of a mod/item name)",
+                view,
+                "source",
+            )
+
+        # Should be: "X spell from <i>Iron Spells'n'Spellbooks</i> mod" or
+        # "spells from <i>Iron Spells'n'Spellbooks</i> mod"
+        if (
+            "Iron Spells" in source
+            and "spell" in source.lower()
+            and not SPELL_SOURCE_RE.search(source)
+        ):
+            yield self.violation(
+                f"Effect '{name}': Spell references should follow pattern 'X spell from <i>Iron Spells'n'Spellbooks</i> mod' or 'spells from <i>Iron Spells'n'Spellbooks</i> mod'",
+                view,
+                "source",
+            )
+
+
+def build_rules() -> List[Rule]:
+    """Fresh rule instances (global rules keep per-run state), most important first."""
+    return [
+        NoEmptyFieldsRule(),
+        TextFormattingRule(),
+        DuplicateNamesRule(),
+        OrderingRule(),
+        MaxLevelRule(),
+        DescriptionHtmlRule(),
+        TagsRule(),
+        PotionGroupingRule(),
+        SourceHtmlRule(),
+        SourceTermsRule(),
+    ]
+
+
+class ValidationCache:
+    """Clean per-effect results and global-rule results from earlier runs.
+
+    Call save() only after run_rules() has been fully consumed.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or CACHE_PATH
+        self.clean_effects = set()
+        self.global_key = None
+        self.dataset_hash = None
+        self.hits = 0
+        self.checked = 0
+        self._clean_now = set()
+        self._global_key_now = None
+        self._dataset_hash_now = None
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("ruleset_version") == RULESET_VERSION:
+            self.clean_effects = set(data.get("clean_effects", []))
+            self.global_key = data.get("global_key")
+            self.dataset_hash = data.get("dataset_hash")
+
+    @staticmethod
+    def effect_key(effect: dict) -> str:
+        content = _KEY_ENCODER.encode(effect)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def names_key(effects) -> str:
+        """Hash of everything the global rules look at."""
+        names = [[effect.get("mod"), effect.get("effect")] for effect in effects]
+        content = json.dumps(names, ensure_ascii=False)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+    def is_clean(self, key: str) -> bool:
+        """Return True (and keep the entry) if this effect content passed before."""
+        if key in self.clean_effects:
+            self.hits += 1
+            self._clean_now.add(key)
+            return True
+        self.checked += 1
+        return False
+
+    @staticmethod
+    def file_hash(path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def is_dataset_clean(self, dataset_hash: Optional[str], count: int) -> bool:
+        """Return True if this exact file passed every rule before."""
+        if dataset_hash is None or dataset_hash != self.dataset_hash:
+            return False
+        self.hits = count
+        return True
+
+    def mark_clean(self, key: str):
+        self._clean_now.add(key)
+
+    def mark_global_clean(self, names_key: str):
+        self._global_key_now = names_key
+
+    def save(self, dataset_hash: Optional[str] = None):
+        """Record the results of the run (entries for removed effects are dropped).
+
+        Pass the file hash only if the whole run found no violations.
+        """
+        data = {
+            "ruleset_version": RULESET_VERSION,
+            "dataset_hash": dataset_hash,
+            "global_key": self._global_key_now,
+            "clean_effects": sorted(self._clean_now),
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            pass  # Read-only checkout: validation still works, just uncached
+
+
+def run_rules(
+    effects, rules: List[Rule], cache: Optional[ValidationCache] = None
+) -> Iterator[Violation]:
+    """Run every rule over the effects in one traversal, yielding violations.
+
+    With a cache, per-effect rules are skipped for effects known to be clean
+    and global rules are skipped if the names they depend on are unchanged.
+    """
+    names_key = None
+    run_global = True
+    if cache is not None:
+        names_key = ValidationCache.names_key(effects)
+        run_global = names_key != cache.global_key
+    global_clean = True
+
+    for index, effect in enumerate(effects):
+        key = None
+        run_effect = True
+        if cache is not None:
+            key = ValidationCache.effect_key(effect)
+            run_effect = not cache.is_clean(key)
+        if not run_effect and not run_global:
+            continue
+
+        view = EffectView(index, effect)
+        effect_clean = True
+        for rule in rules:
+            if not (run_effect if rule.per_effect else run_global):
+                continue
+            for violation in rule.check(view):
+                if rule.per_effect:
+                    effect_clean = False
+                else:
+                    global_clean = False
+                yield violation
+        if key is not None and run_effect and effect_clean:
+            cache.mark_clean(key)
+
+    if run_global:
+        for rule in rules:
+            for violation in rule.finish():
+                global_clean = False
+                yield violation
+
+    if cache is not None and global_clean:
+        cache.mark_global_clean(names_key)
+
+
+def build_report(effects, rules: List[Rule], violations: List[Violation]) -> dict:
+    """JSON-serializable summary of a collect-all run."""
+    by_rule = {rule.name: 0 for rule in rules}
+    for violation in violations:
+        by_rule[violation.rule] += 1
+    return {
+        "path": str(EFFECTS_PATH),
+        "effects": len(effects),
+        "passed": not violations,
+        "violation_count": len(violations),
+        "by_rule": by_rule,
+        "violations": [violation.to_dict() for violation in violations],
+    }
+
+
+def write_report(report: dict, destination: str):
+    """Write the JSON report to a file, or to stdout for '-'."""
+    content = json.dumps(report, indent=2, ensure_ascii=False)
+    if destination == "-":
+        print(content)
+        return
+    path = Path(destination)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content + "\n", encoding="utf-8")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate data/effects.json.")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Collect every violation instead of stopping at the first",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write all violations as JSON to PATH ('-' for stdout); implies --all",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every effect, ignoring and not updating the cache",
+    )
+    args = parser.parse_args(argv)
+    collect_all = args.all or args.report is not None
+    # Keep stdout pure JSON when the report goes there
+    log = sys.stderr if args.report == "-" else sys.stdout
+
+    print(f"{PREFIX}: 🚀 Starting validation...", file=log)
+    effects = load_effects()
+    rules = build_rules()
+    cache = None if args.no_cache else ValidationCache()
+    dataset_hash = ValidationCache.file_hash(EFFECTS_PATH) if cache else None
 
-    # 9. Source HTML tag usage check
-    print(f"{PREFIX}: 9/10 Source HTML tag usage check started...")
-    validate_source_html_tags(effects)
     print(
-        f"{PREFIX}: ✅ Source HTML tag usage check passed."
-    )  # 10. Source special terms check
-    print(f"{PREFIX}: 10/10 Source special terms check started...")
-    validate_source_special_terms(effects)
-    print(f"{PREFIX}: ✅ Source special terms check passed.")
+        f"{PREFIX}: Running {len(rules)} checks in a single pass over {len(effects)} effects...",
+        file=log,
+    )
+    violations: List[Violation] = []
+    if cache is None or not cache.is_dataset_clean(dataset_hash, len(effects)):
+        for violation in run_rules(effects, rules, cache):
+            if not collect_all:
+                fail(violation.message, EXIT_VIOLATIONS)
+            violations.append(violation)
+        if cache is not None:
+            cache.save(None if violations else dataset_hash)
+
+    if cache is not None:
+        print(
+            f"{PREFIX}: {cache.checked} new or changed effects checked, {cache.hits} unchanged (cached).",
+            file=log,
+        )
+
+    if collect_all:
+        for violation in violations:
+            print(f"{PREFIX} ❌ {violation.message}", file=sys.stderr)
+        if args.report is not None:
+            write_report(build_report(effects, rules, violations), args.report)
+
+        if violations:
+            failed = {violation.rule for violation in violations}
+            for rule in rules:
+                if rule.name not in failed:
+                    print(
+                        f"{PREFIX}: ✅ {rule.number}/{len(rules)} {rule.title} check passed.",
+                        file=log,
+                    )
+            print(
+                f"{PREFIX} ❌ {len(violations)} violation(s) in {len(failed)}/{len(rules)} checks.",
+                file=sys.stderr,
+            )
+            return EXIT_VIOLATIONS
+
+    for rule in rules:
+        print(
+            f"{PREFIX}: ✅ {rule.number}/{len(rules)} {rule.title} check passed.",
+            file=log,
+        )
 
-    print(f"{PREFIX}: ✨ All 10/10 checks passed.")
+    print(f"{PREFIX}: ✨ All {len(rules)}/{len(rules)} checks passed.", file=log)
+    return EXIT_OK
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
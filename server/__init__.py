@@ -0,0 +1,4 @@
+"""
+Server package for Minecraft Status Effects website.
+Provides in-process helpers used by run.py to serve the static site efficiently.
+"""
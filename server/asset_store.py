@@ -0,0 +1,202 @@
+"""
+In-memory static asset store with precompressed variants.
+Loads the public site files once, keeps gzip (and brotli, if installed)
+encodings next to the raw bytes, and picks one per request.
+"""
+
+import glob
+import gzip
+import mimetypes
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from bottle import HTTPResponse
+from server.conditional import (
+    content_etag,
+    http_date,
+    is_not_modified,
+    without_body_headers,
+)
+
+# Optional brotli support (pip install brotli)
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Extensions worth compressing (images are already compressed)
+COMPRESSIBLE_EXTS = {".html", ".css", ".js", ".json", ".xml", ".txt", ".svg", ".ico"}
+
+# Files above this size are left to static_file
+MAX_ASSET_BYTES = 8 * 1024 * 1024
+
+# The public site, relative to the web root. Only these are preloaded, so a
+# virtualenv or other tooling next to the site is never read into memory.
+PUBLIC_ASSET_GLOBS = (
+    "*.html",
+    "*/index.html",
+    "robots.txt",
+    "sitemap.xml",
+    "css/*",
+    "js/*",
+    "img/*",
+    "data/effects*.json",
+)
+
+
+class Asset:
+    """One file held in memory along with its compressed encodings."""
+
+    def __init__(self, relpath: str, raw: bytes, mtime: float, size: int):
+        self.relpath = relpath
+        self.mtime = mtime
+        self.size = size
+        self.mimetype = mimetypes.guess_type(relpath)[0] or "application/octet-stream"
+        if self.mimetype.startswith("text/") or self.mimetype in (
+            "application/json",
+            "application/xml",
+        ):
+            self.mimetype += "; charset=UTF-8"
+        self.last_modified = http_date(mtime)
+        self.etag = content_etag(raw)
+
+        # Encoding name -> body; "identity" is always present
+        self.variants: Dict[str, bytes] = {"identity": raw}
+        if os.path.splitext(relpath)[1].lower() in COMPRESSIBLE_EXTS:
+            gz = gzip.compress(raw, compresslevel=9, mtime=0)
+            if len(gz) < len(raw):
+                self.variants["gzip"] = gz
+            if BROTLI_AVAILABLE:
+                br = brotli.compress(raw, quality=11)
+                if len(br) < len(raw):
+                    self.variants["br"] = br
+
+    def choose_encoding(self, accept_encoding: str) -> str:
+        """Pick the smallest variant the client accepts."""
+        accepted = parse_accept_encoding(accept_encoding)
+        candidates = [
+            encoding
+            for encoding in self.variants
+            if encoding != "identity" and accepted.get(encoding, 0) > 0
+        ]
+        if not candidates:
+            return "identity"
+        return min(candidates, key=lambda encoding: len(self.variants[encoding]))
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {encoding: q-value}."""
+    accepted = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    if "*" in accepted:
+        for encoding in ("gzip", "br"):
+            accepted.setdefault(encoding, accepted["*"])
+    return accepted
+
+
+class AssetStore:
+    """Public site files held in memory, keyed by normalized relative path.
+
+    Each lookup does one os.stat so edits on disk are picked up (the file is
+    re-read and re-compressed once); everything else is served from memory.
+    """
+
+    def __init__(self, root: str, is_forbidden: Callable[[str], bool]):
+        self.root = root
+        self.is_forbidden = is_forbidden
+        self._assets: Dict[str, Asset] = {}
+        self._lock = threading.Lock()
+
+    def preload(
+        self, patterns: Tuple[str, ...] = PUBLIC_ASSET_GLOBS
+    ) -> Tuple[int, int]:
+        """Load the public files matching patterns. Returns (file count, bytes)."""
+        for pattern in patterns:
+            for path in glob.glob(os.path.join(self.root, pattern)):
+                relpath = os.path.normpath(os.path.relpath(path, self.root))
+                if os.path.isfile(path) and not self.is_forbidden(relpath):
+                    self._load(relpath)
+
+        with self._lock:
+            return len(self._assets), sum(a.size for a in self._assets.values())
+
+    def get(self, relpath: str) -> Optional[Asset]:
+        """Return the in-memory asset, reloading it if the file changed."""
+        relpath = os.path.normpath(relpath)
+        asset = self._assets.get(relpath)
+        if asset is None:
+            return None
+        try:
+            stat_result = os.stat(os.path.join(self.root, relpath))
+        except OSError:
+            with self._lock:
+                self._assets.pop(relpath, None)
+            return None
+        if stat_result.st_mtime == asset.mtime and stat_result.st_size == asset.size:
+            return asset
+        return self._load(relpath)
+
+    def serve(
+        self,
+        relpath: str,
+        environ: Dict,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[HTTPResponse]:
+        """Build a response for an in-memory asset, or None if not held."""
+        asset = self.get(relpath)
+        if asset is None:
+            return None
+
+        encoding = asset.choose_encoding(environ.get("HTTP_ACCEPT_ENCODING", ""))
+        body = asset.variants[encoding]
+        etag = asset.etag if encoding == "identity" else f"{asset.etag}-{encoding}"
+
+        headers = {
+            "Content-Type": asset.mimetype,
+            "Content-Length": str(len(body)),
+            "Last-Modified": asset.last_modified,
+            "ETag": f'"{etag}"',
+            "Vary": "Accept-Encoding",
+        }
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Conditional requests, mirroring bottle.static_file
+        if is_not_modified(environ, etag, asset.mtime):
+            return HTTPResponse(status=304, **without_body_headers(headers))
+
+        return HTTPResponse(body, **headers)
+
+    def _load(self, relpath: str) -> Optional[Asset]:
+        """Read a file into memory (skipping oversized ones)."""
+        path = os.path.join(self.root, relpath)
+        try:
+            stat_result = os.stat(path)
+            if stat_result.st_size > MAX_ASSET_BYTES:
+                return None
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+
+        asset = Asset(relpath, raw, stat_result.st_mtime, stat_result.st_size)
+        with self._lock:
+            self._assets[relpath] = asset
+        return asset
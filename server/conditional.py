@@ -0,0 +1,97 @@
+"""
+Conditional request helpers (ETag / Last-Modified).
+Strong ETags are content hashes, so a 304 is only sent for identical bytes.
+"""
+
+import email.utils
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+from bottle import HTTPResponse, parse_date
+
+# path -> ((mtime_ns, size), etag); avoids re-hashing unchanged files
+_file_etags: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_file_etags_lock = threading.Lock()
+
+
+def content_etag(content: bytes) -> str:
+    """Return a strong ETag value (unquoted) for content."""
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+def file_etag(path: str) -> str:
+    """Return a content-hash ETag for a file, re-hashing only when it changes."""
+    stat_result = os.stat(path)
+    version = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _file_etags.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+    etag = hasher.hexdigest()[:32]
+    with _file_etags_lock:
+        _file_etags[path] = (version, etag)
+    return etag
+
+
+def http_date(timestamp: float) -> str:
+    """Format a Unix timestamp as an HTTP date."""
+    return email.utils.formatdate(timestamp, usegmt=True)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an If-None-Match header lists etag (or is '*')."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def is_not_modified(
+    environ: Dict, etag: str, last_modified: Optional[float] = None
+) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since for a resource."""
+    if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    ims = environ.get("HTTP_IF_MODIFIED_SINCE")
+    if ims and last_modified is not None:
+        ims = parse_date(ims.split(";")[0].strip())
+        return ims is not None and ims >= int(last_modified)
+    return False
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[float] = None, cache_control: str = "no-cache"
+) -> Dict[str, str]:
+    """Return ETag/Last-Modified/Cache-Control headers for a response."""
+    headers = {"ETag": f'"{etag}"', "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified_response(
+    environ: Dict, etag: str, last_modified: Optional[float] = None
+) -> Optional[HTTPResponse]:
+    """Return a 304 response if the client's copy is current, else None."""
+    if not is_not_modified(environ, etag, last_modified):
+        return None
+    return HTTPResponse(status=304, **validator_headers(etag, last_modified))
+
+
+def without_body_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Drop entity headers that must not accompany a 304 response."""
+    return {
+        k: v
+        for k, v in headers.items()
+        if k not in ("Content-Length", "Content-Type", "Content-Encoding")
+    }
@@ -0,0 +1,174 @@
+"""
+Ranged, zero-copy file responses for large downloads.
+Handles conditional requests, Range and If-Range, and hands the open file
+to the server's wsgi.file_wrapper so it can be sent with os.sendfile.
+"""
+
+import os
+from typing import Dict, Optional
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler
+from bottle import HTTPError, HTTPResponse, parse_date, parse_range_header
+from server.conditional import (
+    etag_matches,
+    http_date,
+    is_not_modified,
+    without_body_headers,
+)
+
+
+class FileSlice:
+    """File-like view of length bytes of an open file, starting at start.
+
+    Bottle passes any object with read() to wsgi.file_wrapper. fileno()
+    lets sendfile-capable servers send the slice without copying it through
+    Python; they read from the current offset for Content-Length bytes.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def if_range_allows(environ: Dict, etag: str, last_modified: float) -> bool:
+    """Return True if a Range request may be honoured (If-Range absent or current)."""
+    if_range = environ.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        # Only strong validators may be used with If-Range
+        return not if_range.startswith("W/") and etag_matches(if_range, etag)
+    return parse_date(if_range) == int(last_modified)
+
+
+def serve_file(
+    path: str,
+    environ: Dict,
+    etag: str,
+    mimetype: str,
+    download: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+):
+    """Build a (possibly partial or 304) response streaming a file from disk.
+
+    Args:
+        path: File to send.
+        environ: WSGI environ of the current request.
+        etag: Strong ETag value (unquoted), typically a content hash.
+        mimetype: Content-Type to send.
+        download: If set, sent as the attachment file name.
+        headers: Extra headers (e.g. Cache-Control).
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return HTTPError(404, "File not found")
+
+    size = stat_result.st_size
+    last_modified = stat_result.st_mtime
+    response_headers = {
+        "Content-Type": mimetype,
+        "Content-Length": str(size),
+        "Last-Modified": http_date(last_modified),
+        "ETag": f'"{etag}"',
+        "Accept-Ranges": "bytes",
+    }
+    if download:
+        response_headers["Content-Disposition"] = f'attachment; filename="{download}"'
+    if headers:
+        response_headers.update(headers)
+
+    if is_not_modified(environ, etag, last_modified):
+        return HTTPResponse(status=304, **without_body_headers(response_headers))
+
+    status = 200
+    start, end = 0, size
+    if "HTTP_RANGE" in environ and if_range_allows(environ, etag, last_modified):
+        ranges = list(parse_range_header(environ["HTTP_RANGE"], size))
+        if not ranges:
+            return HTTPError(
+                416,
+                "Requested Range Not Satisfiable",
+                **{"Content-Range": f"bytes */{size}"},
+            )
+        # Multiple ranges would need multipart/byteranges; send the first
+        start, end = ranges[0]
+        status = 206
+        response_headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        response_headers["Content-Length"] = str(end - start)
+
+    if environ.get("REQUEST_METHOD") == "HEAD":
+        return HTTPResponse("", status=status, **response_headers)
+
+    body = FileSlice(open(path, "rb"), start, end - start)
+    return HTTPResponse(body, status=status, **response_headers)
+
+
+class SendfileServerHandler(ServerHandler):
+    """wsgiref handler that sends file_wrapper bodies with os.sendfile."""
+
+    def sendfile(self) -> bool:
+        if not hasattr(os, "sendfile"):
+            return False
+        try:
+            in_fd = self.result.filelike.fileno()
+            out_fd = self.request_handler.connection.fileno()
+            count = int(self.headers["Content-Length"])
+        except (AttributeError, OSError, TypeError, ValueError):
+            return False
+
+        if not self.headers_sent:
+            self.send_headers()
+        self._flush()
+
+        offset = os.lseek(in_fd, 0, os.SEEK_CUR)
+        sent = 0
+        while sent < count:
+            n = os.sendfile(out_fd, in_fd, offset + sent, count - sent)
+            if n == 0:
+                break
+            sent += n
+        self.bytes_sent += sent
+        return True
+
+
+class SendfileRequestHandler(WSGIRequestHandler):
+    """WSGIRequestHandler that runs each request through SendfileServerHandler."""
+
+    def handle(self):
+        self.raw_requestline = self.rfile.readline(65537)
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ""
+            self.request_version = ""
+            self.command = ""
+            self.send_error(414)
+            return
+
+        if not self.parse_request():
+            return
+
+        handler = SendfileServerHandler(
+            self.rfile,
+            self.wfile,
+            self.get_stderr(),
+            self.get_environ(),
+            multithread=True,
+        )
+        handler.request_handler = self
+        handler.run(self.server.get_app())
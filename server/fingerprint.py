@@ -0,0 +1,37 @@
+"""
+Content-hash fingerprints for static assets.
+A fingerprinted file (e.g. js/render.3f9a1c07e2.js) never changes once
+written, so it can be cached by browsers indefinitely.
+"""
+
+import hashlib
+import os
+import re
+
+# Hex digits of the content hash embedded in the file name
+HASH_LENGTH = 10
+
+# Asset kinds that get fingerprinted copies
+FINGERPRINT_EXTS = (".js", ".css")
+
+FINGERPRINT_RE = re.compile(
+    r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})(?P<ext>\.(?:js|css))$" % HASH_LENGTH
+)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def content_hash(content: bytes) -> str:
+    """Return the short hash used in fingerprinted file names."""
+    return hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprint_name(path: str, content: bytes) -> str:
+    """Return path with the content hash inserted before the extension."""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{content_hash(content)}{ext}"
+
+
+def is_fingerprinted(path: str) -> bool:
+    """Return True if the file name carries a content hash."""
+    return FINGERPRINT_RE.match(os.path.basename(path)) is not None